@@ -0,0 +1,304 @@
+import pandas as pd
+import numpy as np
+
+
+class RunningStats:
+    """Mergeable count, mean, variance (Welford/Chan), min and max"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        """Add a chunk of values"""
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) == 0:
+            return
+        chunk = RunningStats()
+        chunk.count = len(values)
+        chunk.mean = values.mean()
+        chunk.m2 = ((values - chunk.mean) ** 2).sum()
+        chunk.min = values.min()
+        chunk.max = values.max()
+        self.merge(chunk)
+
+    def merge(self, other):
+        """Combine with another accumulator in place"""
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self):
+        """Sample variance (ddof=1, as pandas)"""
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+
+
+def add_counts(left, right):
+    """``left + right`` over the union of their keys, in first-seen order
+
+    ``Series.add`` sorts the union index; here keys keep the order they first
+    appeared in, left before right, as ``value_counts`` breaks ties.
+    """
+    index = left.index.append(right.index.difference(left.index, sort=False))
+    return left.reindex(index, fill_value=0) + right.reindex(index, fill_value=0)
+
+
+class ValueCounts:
+    """Exact counting histogram of a discrete column, keys in first-seen order"""
+
+    def __init__(self, counts=None):
+        self.counts = pd.Series(dtype=np.int64) if counts is None else counts
+
+    def update(self, values):
+        """Add a chunk of values"""
+        values = pd.Series(values)
+        chunk = values.value_counts(sort=False).reindex(pd.unique(values.dropna()))
+        chunk.index = pd.Index(chunk.index.to_numpy())
+        self.counts = add_counts(self.counts, chunk).astype(np.int64)
+
+    def merge(self, other):
+        """Combine with another accumulator in place"""
+        self.counts = add_counts(self.counts, other.counts).astype(np.int64)
+
+    @property
+    def total(self):
+        return int(self.counts.sum())
+
+    def mean(self):
+        if self.total == 0:
+            return np.nan
+        counts = self.counts.sort_index()
+        return (counts.index.to_numpy(dtype=np.float64) * counts.to_numpy()).sum() / self.total
+
+    def std(self):
+        """Sample standard deviation (ddof=1, as pandas)"""
+        counts = self.counts[self.counts > 0]
+        values = counts.index.to_numpy(dtype=np.float64)
+        total = counts.sum()
+        if total < 2:
+            return np.nan
+        mean = (values * counts.to_numpy()).sum() / total
+        return np.sqrt((counts.to_numpy() * (values - mean) ** 2).sum() / (total - 1))
+
+    def min(self):
+        return self.counts[self.counts > 0].index.min()
+
+    def max(self):
+        return self.counts[self.counts > 0].index.max()
+
+    def median(self):
+        """Exact median; averages the two middle values for even counts, NaN when empty"""
+        counts = self.counts[self.counts > 0].sort_index()
+        if counts.empty:
+            return np.nan
+        cumulative = counts.cumsum().to_numpy()
+        values = counts.index.to_numpy()
+        total = cumulative[-1]
+        lower = values[np.searchsorted(cumulative, (total - 1) // 2 + 1)]
+        upper = values[np.searchsorted(cumulative, total // 2 + 1)]
+        return (lower + upper) / 2
+
+    def most_common(self):
+        """Counts sorted descending, ties in first-seen order as ``value_counts``"""
+        counts = self.counts[self.counts > 0]
+        return counts.sort_values(ascending=False, kind='stable')
+
+
+class GroupStats:
+    """Mergeable per-group count, sum and sum of squares"""
+
+    def __init__(self):
+        self.table = pd.DataFrame(columns=['count', 'sum', 'sumsq'], dtype=np.float64)
+
+    def update(self, keys, values):
+        """Add a chunk of group keys and their values"""
+        values = np.asarray(values, dtype=np.float64)
+        chunk = pd.DataFrame({'count': 1.0, 'sum': values, 'sumsq': values ** 2})
+        chunk = chunk.groupby(np.asarray(keys)).sum()
+        self.table = self.table.add(chunk, fill_value=0)
+
+    def merge(self, other):
+        """Combine with another accumulator in place"""
+        self.table = self.table.add(other.table, fill_value=0)
+
+    def mean(self):
+        return self.table['sum'] / self.table['count']
+
+
+class CovarianceAccumulator:
+    """Mergeable mean vector and co-moment matrix for Pearson correlation"""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.count = 0
+        self.mean = np.zeros(len(self.columns))
+        self.comoment = np.zeros((len(self.columns), len(self.columns)))
+
+    def update(self, df):
+        """Add a chunk of rows"""
+        values = df[self.columns].to_numpy(dtype=np.float64)
+        if len(values) == 0:
+            return
+        chunk = CovarianceAccumulator(self.columns)
+        chunk.count = len(values)
+        chunk.mean = values.mean(axis=0)
+        centered = values - chunk.mean
+        chunk.comoment = centered.T @ centered
+        self.merge(chunk)
+
+    def merge(self, other):
+        """Combine with another accumulator in place"""
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.comoment += other.comoment + np.outer(delta, delta) * self.count * other.count / count
+        self.mean += delta * other.count / count
+        self.count = count
+
+    def subtract(self, other):
+        """Remove rows previously added as ``other`` (inverse of ``merge``)"""
+        if other.count == 0:
+            return
+        count = self.count - other.count
+        if count <= 0:
+            self.count = 0
+            self.mean = np.zeros(len(self.columns))
+            self.comoment = np.zeros((len(self.columns), len(self.columns)))
+            return
+        mean = (self.mean * self.count - other.mean * other.count) / count
+        delta = other.mean - mean
+        self.comoment -= other.comoment + np.outer(delta, delta) * count * other.count / self.count
+        self.mean = mean
+        self.count = count
+
+    def covariance(self):
+        return pd.DataFrame(self.comoment / (self.count - 1),
+                            index=self.columns, columns=self.columns)
+
+    def correlation(self):
+        scale = np.sqrt(np.diag(self.comoment))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = self.comoment / np.outer(scale, scale)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+
+class DensityGrid:
+    """Mergeable 2D histogram over fixed bin edges"""
+
+    def __init__(self, x_edges, y_edges):
+        self.x_edges = np.asarray(x_edges, dtype=np.float64)
+        self.y_edges = np.asarray(y_edges, dtype=np.float64)
+        self.counts = np.zeros((len(self.x_edges) - 1, len(self.y_edges) - 1), dtype=np.int64)
+
+    def update(self, x, y):
+        """Add a chunk of points"""
+        counts, _, _ = np.histogram2d(np.asarray(x, dtype=np.float64),
+                                      np.asarray(y, dtype=np.float64),
+                                      bins=[self.x_edges, self.y_edges])
+        self.counts += counts.astype(np.int64)
+
+    def merge(self, other):
+        """Combine with another grid over the same edges in place"""
+        self.counts += other.counts
+
+
+class TopK:
+    """Mergeable k best rows, overall or per group
+
+    Rows rank by ``order``, a list of (column, ascending) pairs: by default
+    highest rating, then most reviews, then lowest ``restaurant_id``, so ties
+    resolve the same way however the data is chunked or partitioned. At most
+    ``k`` rows per group are kept, and chunk rows that cannot beat the current
+    k-th row of their group are dropped before sorting. Rows missing the
+    first ranking value (e.g. an unrated restaurant) are never ranked.
+    """
+
+    ORDER = [('rating', False), ('num_reviews', False), ('restaurant_id', True)]
+
+    def __init__(self, k=10, by=None, columns=None, order=None):
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        self.k = k
+        self.by = by
+        self.columns = columns
+        self.order = list(order or self.ORDER)
+        self.rows = None
+
+    def _floor(self, chunk):
+        """Mask of chunk rows at least as good as the k-th kept row of their group"""
+        first, ascending = self.order[0]
+        values = chunk[first].to_numpy()
+        if self.rows is None:
+            return np.ones(len(chunk), dtype=bool)
+        if self.by is None:
+            if len(self.rows) < self.k:
+                return np.ones(len(chunk), dtype=bool)
+            floor = self.rows[first].iloc[-1]
+            return values <= floor if ascending else values >= floor
+        kept = self.rows.groupby(self.by, observed=True)[first]
+        floors = kept.last().where(kept.size() >= self.k)
+        floor = chunk[self.by].map(floors).to_numpy(dtype=np.float64)
+        unknown = np.isnan(floor)
+        return unknown | (values <= floor if ascending else values >= floor)
+
+    def _select(self, rows):
+        """Best ``k`` rows per group, sorted by group then rank"""
+        columns, ascending = [list(item) for item in zip(*self.order)]
+        if self.by is not None:
+            columns, ascending = [self.by] + columns, [True] + ascending
+        rows = rows.sort_values(columns, ascending=ascending, kind='stable')
+        if self.by is None:
+            return rows.head(self.k)
+        return rows.groupby(self.by, observed=True, sort=False).head(self.k)
+
+    def update(self, chunk):
+        """Add a chunk of rows"""
+        if self.columns is not None:
+            chunk = chunk[[col for col in self.columns if col in chunk.columns]]
+        chunk = chunk[chunk[self.order[0][0]].notna()]
+        chunk = chunk[self._floor(chunk)]
+        if self.by is None and len(chunk) > self.k:
+            # Anything outside the k best primary values cannot make the cut
+            first, ascending = self.order[0]
+            values = chunk[first].to_numpy()
+            kth = np.partition(values, self.k - 1)[self.k - 1] if ascending else \
+                np.partition(values, len(values) - self.k)[len(values) - self.k]
+            chunk = chunk[values <= kth if ascending else values >= kth]
+        self._add(chunk)
+
+    def merge(self, other):
+        """Combine with another TopK of the same k, grouping and order in place"""
+        if other.rows is not None:
+            self._add(other.rows)
+
+    def _add(self, rows):
+        if len(rows) == 0 and self.rows is not None:
+            return
+        rows = rows if self.rows is None else pd.concat([self.rows, rows])
+        self.rows = self._select(rows)
+
+    def result(self):
+        """Kept rows with a 1-based ``rank`` within their group"""
+        if self.rows is None:
+            return pd.DataFrame()
+        rows = self.rows.reset_index(drop=True)
+        if self.by is None:
+            rank = np.arange(1, len(rows) + 1)
+        else:
+            rank = rows.groupby(self.by, observed=True).cumcount().to_numpy() + 1
+        return rows.assign(rank=rank)
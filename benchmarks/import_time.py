@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Import-time budget for analysis-only startup
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter,
+reports the total and the slowest imports, and exits non-zero if the best of
+``--repeat`` runs exceeds ``--budget-ms`` or if a plotting-only dependency
+(matplotlib, seaborn, scipy) was imported. The plotting-dependency check
+also runs under pytest as ``tests/test_imports.py``.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --module restaurant_analysis --budget-ms 400
+"""
+
+import os
+import re
+import sys
+import argparse
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Packages only the chart code paths may load
+FORBIDDEN = ['matplotlib', 'seaborn', 'scipy']
+
+LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)')
+
+
+def import_times(module):
+    """Parse one ``-X importtime`` run into (self_us, cumulative_us, depth, name) rows"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=REPO_ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr}")
+    rows = []
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((int(self_us), int(cumulative_us), len(indent) // 2, name))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check analysis-only import time against a budget")
+    parser.add_argument('--module', default='main', help="module to import (default: main)")
+    parser.add_argument('--budget-ms', type=float, default=500.0,
+                        help="maximum import time in milliseconds (default: 500)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="runs to take the fastest of (default: 3)")
+    parser.add_argument('--top', type=int, default=10, help="slowest imports to list")
+    args = parser.parse_args(argv)
+
+    runs = [import_times(args.module) for _ in range(args.repeat)]
+    totals = [sum(cumulative for _, cumulative, depth, _ in rows if depth == 0) for rows in runs]
+    best = min(range(len(runs)), key=totals.__getitem__)
+    rows, total_ms = runs[best], totals[best] / 1000
+
+    print(f"import {args.module}: {total_ms:.1f} ms (best of {args.repeat}, budget {args.budget_ms:.0f} ms)")
+    print(f"\nSlowest imports (cumulative):")
+    for _, cumulative, _, name in sorted(rows, key=lambda r: -r[1])[:args.top]:
+        print(f"  • {name}: {cumulative / 1000:.1f} ms")
+
+    loaded = {name.split('.')[0] for _, _, _, name in rows}
+    forbidden = [name for name in FORBIDDEN if name in loaded]
+
+    failed = False
+    if forbidden:
+        print(f"\n✗ Plotting dependencies imported at startup: {', '.join(forbidden)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"\n✗ Import time {total_ms:.1f} ms exceeds budget of {args.budget_ms:.0f} ms")
+        failed = True
+    if not failed:
+        print("\n✓ Import time within budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Load test for query_service.py
+
+Sends GET requests from concurrent threads, each with its own keep-alive
+``requests.Session``, and reports throughput and p50/p90/p99 latency.
+
+Usage:
+    python query_service.py &
+    python benchmarks/load_test.py --requests 5000 --concurrency 16
+"""
+
+import sys
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import requests
+
+# Mix of cached and parameterised queries
+DEFAULT_PATHS = [
+    '/rating',
+    '/cuisines?top=10',
+    '/cities',
+    '/price',
+    '/correlation',
+    '/correlation?method=spearman',
+    '/query?city=Pune',
+    '/query?city=Mumbai&price_range=1,2',
+    '/query?cuisine=North Indian&vegetarian=true',
+    '/query?rating=4.2:&cost_for_two=500:900&delivery_time=:30',
+    '/group?by=city&value=cost_for_two'
+]
+
+
+def run(base_url, paths, num_requests, concurrency, timeout=10):
+    """Issue ``num_requests`` requests; returns (latencies in seconds, errors, wall time)"""
+    local = threading.local()
+
+    def fetch(i):
+        if not hasattr(local, 'session'):
+            local.session = requests.Session()
+        start = time.perf_counter()
+        try:
+            response = local.session.get(base_url + paths[i % len(paths)], timeout=timeout)
+            ok = response.status_code == 200
+        except requests.RequestException:
+            ok = False
+        return time.perf_counter() - start, ok
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(fetch, range(num_requests)))
+    wall = time.perf_counter() - start
+
+    latencies = np.array([latency for latency, ok in results if ok])
+    errors = sum(1 for _, ok in results if not ok)
+    return latencies, errors, wall
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the restaurant query service")
+    parser.add_argument('--url', default='http://127.0.0.1:8765', help="service base URL")
+    parser.add_argument('--requests', type=int, default=2000, help="total requests to send")
+    parser.add_argument('--concurrency', type=int, default=8, help="concurrent client threads")
+    parser.add_argument('--path', action='append', dest='paths',
+                        help="request path (repeatable; default: a mix of every endpoint)")
+    args = parser.parse_args(argv)
+
+    try:
+        requests.get(args.url + '/health', timeout=5).raise_for_status()
+    except requests.RequestException as e:
+        print(f"✗ Service not reachable at {args.url}: {e}")
+        return 1
+
+    latencies, errors, wall = run(args.url, args.paths or DEFAULT_PATHS,
+                                  args.requests, args.concurrency)
+    print(f"Requests: {args.requests} ({args.concurrency} concurrent), errors: {errors}")
+    print(f"Throughput: {args.requests / wall:,.0f} requests/s")
+    if len(latencies):
+        p50, p90, p99 = np.percentile(latencies, [50, 90, 99]) * 1000
+        print(f"Latency: p50 {p50:.2f} ms, p90 {p90:.2f} ms, p99 {p99:.2f} ms, "
+              f"max {latencies.max() * 1000:.2f} ms")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
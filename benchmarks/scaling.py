@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark with stored baselines and regression gates
+
+Sweeps ``num_records`` through data generation, save/load, every
+RestaurantAnalysis method and every RestaurantVisualizations chart, and
+records time, throughput (rows/s) and peak traced memory per operation.
+Timings come from passes without tracemalloc, which slows allocation-heavy
+code such as CSV writing many times over; peak memory comes from one extra
+traced pass. Runs offline: data is generated locally and charts render on Agg.
+
+Usage:
+    # record a baseline
+    python benchmarks/scaling.py --sizes 1000 100000 1000000 --save-baseline baseline.json
+
+    # later: compare, exit code 1 if anything regressed beyond the tolerance
+    python benchmarks/scaling.py --sizes 1000 100000 1000000 --baseline baseline.json
+"""
+
+import io
+import os
+import sys
+import json
+import platform
+import argparse
+import tempfile
+from contextlib import redirect_stdout
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from generate_sample_data import RestaurantDataGenerator
+from restaurant_analysis import RestaurantAnalysis
+from visualizations import RestaurantVisualizations, CHARTS
+from instrumentation import Instrumentation
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+# RestaurantAnalysis calls timed on a freshly invalidated instance
+ANALYSIS_CALLS = [
+    ('profile', (), {}),
+    ('rating_analysis', (), {}),
+    ('cuisine_analysis', (), {}),
+    ('price_analysis', (), {}),
+    ('correlation_analysis', (), {}),
+    ('correlation_analysis[spearman]', ('spearman',), {}),
+    ('group_stats[city]', ('city',), {'n_jobs': 1}),
+    ('build_indexes', (), {}),
+    ('query_summary', (), {'cuisine': 'North Indian', 'city': 'Pune', 'price_range': 2}),
+    ('memory_report', (), {}),
+    ('generate_report', (), {})
+]
+
+
+def warm_up():
+    """Draw one small chart so font caches are not billed to the first plot"""
+    with redirect_stdout(io.StringIO()):
+        df = RestaurantDataGenerator().generate_sample_data(num_records=100, vectorized=True)
+    plt.close(RestaurantVisualizations(df).plot_rating_distribution())
+
+
+def run_sizes(sizes, file_format='csv', repeat=1, memory=True):
+    """Benchmark every operation at every size; returns {size: {op: metrics}}"""
+    warm_up()
+    results = {}
+    for n in sizes:
+        print(f"\n[{n:,} rows]")
+        results[str(n)] = run_size(n, file_format, repeat, memory)
+    return results
+
+
+def run_size(n, file_format, repeat, memory):
+    """Best-of-``repeat`` timings, plus traced peak memory, at one size"""
+    best = {}
+    for _ in range(repeat):
+        for op, seconds in measure(n, file_format, trace_memory=False).items():
+            if op not in best or seconds < best[op]['seconds']:
+                best[op] = {'seconds': seconds,
+                            'rows_per_s': n / seconds if seconds > 0 else float('inf'),
+                            'peak_mb': None}
+    if memory:
+        for op, peak_mb in measure(n, file_format, trace_memory=True).items():
+            best[op]['peak_mb'] = peak_mb
+
+    for op, metrics in best.items():
+        line = f"  • {op}: {metrics['seconds']:.3f}s, {metrics['rows_per_s']:,.0f} rows/s"
+        if metrics['peak_mb'] is not None:
+            line += f", peak {metrics['peak_mb']:.1f} MB"
+        print(line)
+    return best
+
+
+def measure(n, file_format, trace_memory):
+    """One pass over every operation at ``n`` rows
+
+    Returns ``{op: peak MB}`` when tracing memory, else ``{op: seconds}``.
+    """
+    hooks = Instrumentation(echo=False, trace_memory=trace_memory)
+    generator = RestaurantDataGenerator()
+    try:
+        with tempfile.TemporaryDirectory() as tmp, redirect_stdout(io.StringIO()):
+            path = os.path.join(tmp, f'restaurants.{file_format}')
+
+            with hooks.stage('generate_sample_data'):
+                df = generator.generate_sample_data(num_records=n, vectorized=True)
+            with hooks.stage('save_data'):
+                generator.save_data(df, path)
+            del df
+
+            analysis = RestaurantAnalysis()
+            with hooks.stage('load_data'):
+                analysis.load_data(path)
+
+            for name, args, kwargs in ANALYSIS_CALLS:
+                analysis.invalidate()
+                with hooks.stage(name):
+                    getattr(analysis, name.split('[')[0])(*args, **kwargs)
+
+            viz = RestaurantVisualizations(analysis.df, profile=analysis.profile(),
+                                           correlation=analysis.correlation_analysis())
+            for _, method in CHARTS:
+                with hooks.stage(method):
+                    plt.close(getattr(viz, method)())
+    finally:
+        hooks.close()
+
+    key = 'peak_alloc_mb' if trace_memory else 'wall_s'
+    return {record['stage']: record[key] for record in hooks.records}
+
+
+def compare(results, baseline, tolerance, min_seconds, min_mb):
+    """Regressions against ``baseline`` as printable strings
+
+    An operation regresses when it is more than ``tolerance`` (relative)
+    slower or hungrier than its baseline and the absolute difference also
+    exceeds ``min_seconds`` / ``min_mb``, which keeps timer noise on tiny
+    inputs from failing the gate.
+    """
+    regressions = []
+    for size, ops in results.items():
+        for op, metrics in ops.items():
+            base = baseline.get(size, {}).get(op)
+            if base is None:
+                continue
+            slower = metrics['seconds'] - base['seconds']
+            if slower > min_seconds and metrics['seconds'] > base['seconds'] * (1 + tolerance):
+                regressions.append(f"{op} @ {int(size):,} rows: {base['seconds']:.3f}s -> "
+                                   f"{metrics['seconds']:.3f}s (+{slower / base['seconds']:.0%})")
+            if metrics['peak_mb'] is None or base['peak_mb'] is None:
+                continue
+            grown = metrics['peak_mb'] - base['peak_mb']
+            if grown > min_mb and metrics['peak_mb'] > base['peak_mb'] * (1 + tolerance):
+                regressions.append(f"{op} @ {int(size):,} rows: peak {base['peak_mb']:.1f} MB -> "
+                                   f"{metrics['peak_mb']:.1f} MB")
+    return regressions
+
+
+def environment():
+    """Machine and library versions stored alongside a baseline"""
+    return {'python': platform.python_version(), 'platform': platform.platform(),
+            'cpu_count': os.cpu_count(), 'numpy': np.__version__,
+            'pandas': pd.__version__, 'matplotlib': matplotlib.__version__}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Restaurant analysis scaling benchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="num_records values to sweep (default: 1k to 10M)")
+    parser.add_argument('--format', default='csv', choices=['csv', 'parquet', 'feather'],
+                        help="file format for save_data/load_data (default: csv)")
+    parser.add_argument('--repeat', type=int, default=1,
+                        help="passes per size; the fastest is kept (default: 1)")
+    parser.add_argument('--no-memory', action='store_true',
+                        help="skip the traced pass that measures peak memory")
+    parser.add_argument('--save-baseline', metavar='PATH', help="write results as a baseline JSON")
+    parser.add_argument('--baseline', metavar='PATH', help="compare against a baseline JSON")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed relative slowdown or memory growth (default: 0.25)")
+    parser.add_argument('--min-seconds', type=float, default=0.05,
+                        help="ignore slowdowns smaller than this (default: 0.05)")
+    parser.add_argument('--min-mb', type=float, default=5.0,
+                        help="ignore memory growth smaller than this (default: 5)")
+    args = parser.parse_args(argv)
+
+    results = run_sizes(args.sizes, args.format, args.repeat, memory=not args.no_memory)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump({'environment': environment(), 'format': args.format,
+                       'results': results}, f, indent=2)
+        print(f"\nBaseline written to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get('environment') != environment():
+            print("\nNote: baseline was recorded on a different machine or library versions")
+        regressions = compare(results, baseline['results'], args.tolerance,
+                              args.min_seconds, args.min_mb)
+        if regressions:
+            print(f"\n✗ {len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+            for line in regressions:
+                print(f"  • {line}")
+            return 1
+        print(f"\n✓ No regressions beyond {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Accuracy check of the approximate sketches against exact counts
+
+Streams Zipf-distributed keys (a stand-in for restaurant names or dishes
+with many distinct values) in chunks into sketches split across simulated
+workers, merges them, round-trips them through ``save``/``load`` and checks
+each documented error bound against ``nunique()``/``value_counts()``:
+
+- HyperLogLog within 4 standard errors of the exact distinct count
+- Count-Min never below the true count, and above it by more than
+  ``epsilon * N`` for at most a ``delta`` share of keys
+- Space-Saving counts bracket the true counts, errors stay within
+  ``N / capacity`` and every key more frequent than that is reported
+
+Exits with status 1 if any bound is violated. The same bounds are checked,
+with the helpers below, on a smaller stream in ``tests/test_sketches.py``.
+
+Usage:
+    python benchmarks/sketch_accuracy.py --rows 5000000 --skew 1.1
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sketches import HyperLogLog, CountMinSketch, SpaceSaving
+
+
+def generate_keys(rows, skew, seed=0):
+    """Zipf-distributed string keys with many distinct values"""
+    rng = np.random.default_rng(seed)
+    ids = rng.zipf(skew, rows) % (rows * 10)
+    return pd.Series(ids).astype(str).radd('restaurant-').astype('category')
+
+
+def exact_counts(keys):
+    """Exact count per key, keyed by plain strings like the sketch results"""
+    exact = keys.value_counts()
+    exact = exact[exact > 0]
+    exact.index = pd.Index(exact.index.astype(str))
+    return exact
+
+
+def build(keys, chunksize, workers, factory):
+    """Sketch ``keys`` chunk by chunk on ``workers`` sketches, then merge them"""
+    sketches = [factory() for _ in range(workers)]
+    for number, start in enumerate(range(0, len(keys), chunksize)):
+        sketches[number % workers].update(keys.iloc[start:start + chunksize])
+    for other in sketches[1:]:
+        sketches[0].merge(other)
+    return sketches[0]
+
+
+def round_trip(sketch, directory):
+    path = os.path.join(directory, f'{type(sketch).__name__}.npz')
+    sketch.save(path)
+    return type(sketch).load(path)
+
+
+def check(label, ok, detail):
+    print(f"{'✓' if ok else '✗'} {label}: {detail}")
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check sketch error bounds against exact counts")
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--skew', type=float, default=1.2, help="Zipf exponent (> 1)")
+    parser.add_argument('--chunksize', type=int, default=250_000)
+    parser.add_argument('--workers', type=int, default=4, help="sketches merged at the end")
+    parser.add_argument('--p', type=int, default=14, help="HyperLogLog precision")
+    parser.add_argument('--epsilon', type=float, default=0.001)
+    parser.add_argument('--delta', type=float, default=0.01)
+    parser.add_argument('--capacity', type=int, default=1000, help="Space-Saving counters")
+    args = parser.parse_args(argv)
+
+    keys = generate_keys(args.rows, args.skew)
+    start = time.perf_counter()
+    exact = exact_counts(keys)
+    exact_seconds = time.perf_counter() - start
+    print(f"{args.rows:,} rows, {len(exact):,} distinct keys "
+          f"(exact counts: {exact_seconds:.2f}s)\n")
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        hll = round_trip(build(keys, args.chunksize, args.workers,
+                               lambda: HyperLogLog(args.p)), directory)
+        error = abs(hll.count() - len(exact)) / len(exact)
+        results.append(check('HyperLogLog', error <= 4 * hll.relative_error,
+                             f"{hll.count():,} vs {len(exact):,} ({error:.2%} off, "
+                             f"standard error {hll.relative_error:.2%}, "
+                             f"{hll.registers.nbytes / 1024:.0f} KiB, "
+                             f"{time.perf_counter() - start:.2f}s)"))
+
+        start = time.perf_counter()
+        cms = round_trip(build(keys, args.chunksize, args.workers,
+                               lambda: CountMinSketch(args.epsilon, args.delta)), directory)
+        overcount = cms.estimate(exact.index.to_numpy()) - exact.to_numpy()
+        beyond = (overcount > cms.error_bound).mean()
+        results.append(check('Count-Min', overcount.min() >= 0 and beyond <= args.delta,
+                             f"max overcount {overcount.max():,} (bound {cms.error_bound:,.0f}), "
+                             f"{beyond:.3%} of keys beyond it (allowed {args.delta:.0%}), "
+                             f"{cms.table.nbytes / 1024:.0f} KiB, "
+                             f"{time.perf_counter() - start:.2f}s"))
+
+        start = time.perf_counter()
+        space_saving = round_trip(build(keys, args.chunksize, args.workers,
+                                        lambda: SpaceSaving(args.capacity)), directory)
+        top = space_saving.top(args.capacity)
+        true = exact.reindex(top.index, fill_value=0)
+        bracketed = ((top['count'] >= true) & (top['count'] - top['error'] <= true)).all()
+        bound = args.rows / args.capacity
+        frequent = exact.index[exact > bound]
+        missing = frequent.difference(top.index)
+        results.append(check('Space-Saving',
+                             bracketed and space_saving.error_bound <= bound and not len(missing),
+                             f"counts bracket true counts: {bracketed}, max error "
+                             f"{space_saving.error_bound:,} (bound {bound:,.0f}), "
+                             f"{len(frequent) - len(missing)}/{len(frequent)} keys above the "
+                             f"bound reported, {time.perf_counter() - start:.2f}s"))
+
+        head = top.head(10).assign(true=true.head(10))
+        print(f"\nTop 10 by Space-Saving:\n{head}")
+
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+import pandas as pd
+import numpy as np
+
+# Low-cardinality columns that get one bitmap per distinct value
+BITMAP_COLUMNS = ['cuisine', 'city', 'price_range', 'vegetarian', 'has_online_delivery']
+
+
+def _pack(mask):
+    """Pack a boolean mask into little-endian uint64 words"""
+    packed = np.packbits(mask, bitorder='little')
+    padded = np.zeros(-(-len(packed) // 8) * 8, dtype=np.uint8)
+    padded[:len(packed)] = packed
+    return padded.view(np.uint64)
+
+
+def _scalar(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class BitmapIndex:
+    """Per-value bitmaps over low-cardinality columns
+
+    Each (column, value) pair is stored as a packed bitmap with one bit per
+    row, so a filter such as "North Indian in Pune, price range 2" becomes a
+    few word-wise AND/OR operations over n/64 words instead of a scan of
+    every row.
+    """
+
+    def __init__(self, df, columns=None):
+        self.num_rows = len(df)
+        self.bitmaps = {}
+        for col in columns or [c for c in BITMAP_COLUMNS if c in df.columns]:
+            codes, uniques = pd.factorize(df[col])
+            self.bitmaps[col] = {_scalar(value): _pack(codes == code)
+                                 for code, value in enumerate(uniques)}
+        self._all = _pack(np.ones(self.num_rows, dtype=bool))
+        self._none = np.zeros_like(self._all)
+
+    def query(self, **filters):
+        """Return the bitmap of rows matching every filter
+
+        Each keyword names an indexed column; a single value must match
+        exactly and a list/tuple/set matches any of its values (none if empty).
+        """
+        result = None
+        for col, values in filters.items():
+            if col not in self.bitmaps:
+                raise KeyError(f"No bitmap index for column '{col}'")
+            if not isinstance(values, (list, tuple, set)):
+                values = [values]
+            bitmaps = [self.bitmaps[col].get(_scalar(value), self._none) for value in values]
+            if not bitmaps:
+                matched = self._none
+            elif len(bitmaps) == 1:
+                matched = bitmaps[0]
+            else:
+                matched = np.bitwise_or(bitmaps[0], bitmaps[1])
+                for bitmap in bitmaps[2:]:
+                    np.bitwise_or(matched, bitmap, out=matched)
+
+            if result is None:
+                result = matched.copy()
+            else:
+                np.bitwise_and(result, matched, out=result)
+        return self._all.copy() if result is None else result
+
+    def rows(self, bitmap):
+        """Row positions set in ``bitmap``, unpacking only non-empty words"""
+        words = np.flatnonzero(bitmap)
+        bits = np.unpackbits(bitmap[words].view(np.uint8), bitorder='little').reshape(-1, 64)
+        word_rows, bit_cols = np.nonzero(bits)
+        return words[word_rows] * 64 + bit_cols
+
+    def contains(self, bitmap, rows):
+        """Boolean mask of which ``rows`` are set in ``bitmap``"""
+        rows = np.asarray(rows, dtype=np.int64)
+        words = bitmap[rows >> 6]
+        return ((words >> (rows & 63).astype(np.uint64)) & np.uint64(1)).astype(bool)
+
+    def count(self, bitmap):
+        """Number of rows set in ``bitmap``"""
+        if hasattr(np, 'bitwise_count'):
+            return int(np.bitwise_count(bitmap).sum())
+        return int(np.unpackbits(bitmap.view(np.uint8)).sum())
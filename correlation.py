@@ -0,0 +1,72 @@
+import pandas as pd
+import numpy as np
+from data_io import SCHEMA, iter_frames
+from accumulators import RunningStats, CovarianceAccumulator
+
+# Quantitative columns correlated by default; restaurant_id is a key, not a measure
+NUMERIC_COLUMNS = ['rating', 'num_reviews', 'price_range', 'delivery_time', 'cost_for_two']
+
+
+def _chunks(source, columns, chunksize):
+    """Yield ``columns`` of a DataFrame or data file in bounded chunks"""
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunksize):
+            # Slice rows first: projecting the whole frame per chunk copies it
+            yield source.iloc[start:start + chunksize][columns]
+    else:
+        yield from iter_frames(source, columns, SCHEMA, chunksize)
+
+
+def pearson_matrix(source, columns=None, chunksize=1_000_000):
+    """Pearson correlation from one pass of chunked co-moments"""
+    columns = list(columns or NUMERIC_COLUMNS)
+    acc = CovarianceAccumulator(columns)
+    for chunk in _chunks(source, columns, chunksize):
+        acc.update(chunk)
+    return acc.correlation()
+
+
+def spearman_matrix(source, columns=None, bins=1024, chunksize=1_000_000):
+    """Approximate Spearman correlation from binned ranks
+
+    Values are bucketed into ``bins`` equal-width bins per column and every
+    value in a bin gets the bin's average rank, i.e. values sharing a bin are
+    treated as ties. Columns with at most ``bins`` distinct, evenly spaced
+    values (ratings, price ranges, minutes, ...) therefore get their exact
+    Spearman coefficient. Needs three passes (range, bin counts, rank
+    co-moments) but only O(bins) memory per column.
+    """
+    columns = list(columns or NUMERIC_COLUMNS)
+
+    ranges = {col: RunningStats() for col in columns}
+    for chunk in _chunks(source, columns, chunksize):
+        for col in columns:
+            ranges[col].update(chunk[col])
+
+    edges = {col: np.linspace(ranges[col].min, ranges[col].max, bins + 1) for col in columns}
+
+    def bin_ids(chunk, col):
+        ids = np.searchsorted(edges[col], chunk[col].to_numpy(dtype=np.float64), side='right') - 1
+        return np.clip(ids, 0, bins - 1)
+
+    counts = {col: np.zeros(bins, dtype=np.int64) for col in columns}
+    for chunk in _chunks(source, columns, chunksize):
+        for col in columns:
+            counts[col] += np.bincount(bin_ids(chunk, col), minlength=bins)
+
+    mid_ranks = {col: np.cumsum(counts[col]) - (counts[col] - 1) / 2 for col in columns}
+
+    acc = CovarianceAccumulator(columns)
+    for chunk in _chunks(source, columns, chunksize):
+        ranks = pd.DataFrame({col: mid_ranks[col][bin_ids(chunk, col)] for col in columns})
+        acc.update(ranks)
+    return acc.correlation()
+
+
+def correlation_matrix(source, columns=None, method='pearson', chunksize=1_000_000, bins=1024):
+    """Pearson or approximate Spearman matrix over a DataFrame or data file"""
+    if method == 'pearson':
+        return pearson_matrix(source, columns, chunksize)
+    if method == 'spearman':
+        return spearman_matrix(source, columns, bins, chunksize)
+    raise ValueError(f"Unknown correlation method '{method}'")
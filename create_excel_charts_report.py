@@ -1,63 +1,138 @@
+import sys
+import argparse
 import pandas as pd
+import numpy as np
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
-import json
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.chart import BarChart, LineChart, PieChart, Reference
+from openpyxl.styles import Font, PatternFill, Alignment
+from restaurant_analysis import RestaurantAnalysis
+
+# Rows per worksheet allowed by Excel, including the header row
+MAX_SHEET_ROWS = 1_048_576
+
+HEADER_FILLS = {1: "1F4E78", 2: "4472C4"}
+
+# Rows reserved per aggregate table on the chart sheet, so charts never overlap
+CHART_BLOCK_ROWS = 18
+
+
+def _strength(r):
+    """Verbal strength of a correlation coefficient"""
+    if abs(r) >= 0.7:
+        return "strong"
+    if abs(r) >= 0.3:
+        return "moderate"
+    return "weak"
+
+
+def _label(column):
+    return column.replace('_', ' ').title()
+
 
 class ExcelChartsReport:
-    """Create comprehensive Excel report with all charts and details"""
-    
-    def __init__(self):
-        self.wb = Workbook()
-        self.ws = self.wb.active
-        self.ws.title = "Charts Summary"
-        self.row = 1
+    """Create comprehensive Excel report with all charts and details
+        
+    Every number in the report is computed from ``analysis`` (a loaded
+    ``RestaurantAnalysis``). The workbook is written in openpyxl's
+    write-only mode, which streams rows to disk as they are appended, so
+    the per-restaurant detail sheets take constant memory however many
+    rows there are; rows beyond Excel's sheet limit continue on further
+    detail sheets.
+    """
+        
+    def __init__(self, analysis):
+        self.analysis = analysis
+        self.wb = Workbook(write_only=True)
+        self.ws = self.wb.create_sheet("Charts Summary")
+        self.ws.column_dimensions['A'].width = 90
+        self.stats = None
+        
+    def _cell(self, ws, value, font=None, fill=None, wrap=False):
+        cell = WriteOnlyCell(ws, value=value)
+        if font:
+            cell.font = font
+        if fill:
+            cell.fill = PatternFill(start_color=fill, end_color=fill, fill_type="solid")
+        if wrap:
+            cell.alignment = Alignment(wrap_text=True)
+        return cell
         
     def add_header(self, title, level=1):
         """Add section header"""
-        self.ws.merge_cells(f'A{self.row}:D{self.row}')
-        cell = self.ws[f'A{self.row}']
-        cell.value = title
-        if level == 1:
-            cell.font = Font(size=16, bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
-        else:
-            cell.font = Font(size=12, bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        self.row += 1
+        size = 16 if level == 1 else 12
+        font = Font(size=size, bold=True, color="FFFFFF")
+        fill = HEADER_FILLS[level]
+        self.ws.append([self._cell(self.ws, title, font, fill)] +
+                       [self._cell(self.ws, None, fill=fill) for _ in range(3)])
         
     def add_chart_details(self, chart_num, title, description, components, insights):
         """Add chart details to Excel"""
         self.add_header(f"CHART {chart_num}: {title}", level=2)
         
         # Description
-        self.ws[f'A{self.row}'] = "Description:"
-        self.ws[f'A{self.row}'].font = Font(bold=True)
-        self.row += 1
-        self.ws[f'A{self.row}'] = description
-        self.ws[f'A{self.row}'].alignment = Alignment(wrap_text=True)
-        self.row += 2
+        self.ws.append([self._cell(self.ws, "Description:", Font(bold=True))])
+        self.ws.append([self._cell(self.ws, description, wrap=True)])
+        self.ws.append([])
         
         # Components
-        self.ws[f'A{self.row}'] = "Components:"
-        self.ws[f'A{self.row}'].font = Font(bold=True)
-        self.row += 1
+        self.ws.append([self._cell(self.ws, "Components:", Font(bold=True))])
         for component in components:
-            self.ws[f'A{self.row}'] = "• " + component
-            self.row += 1
-        self.row += 1
+            self.ws.append(["• " + component])
+        self.ws.append([])
         
         # Insights
-        self.ws[f'A{self.row}'] = "Key Insights:"
-        self.ws[f'A{self.row}'].font = Font(bold=True)
-        self.row += 1
+        self.ws.append([self._cell(self.ws, "Key Insights:", Font(bold=True))])
         for insight in insights:
-            self.ws[f'A{self.row}'] = "✓ " + insight
-            self.row += 1
-        self.row += 2
+            self.ws.append(["✓ " + insight])
+        self.ws.append([])
+        self.ws.append([])
+        
+    def collect_statistics(self):
+        """Compute every figure the report quotes, once"""
+        if self.stats is not None:
+            return self.stats
+        
+        analysis = self.analysis
+        profile = analysis.profile()
+        df = analysis.df
+        rows = profile['rows']
+        
+        delivery_bins = pd.cut(df['delivery_time'], bins=5)
+        rating_by_delivery = df.groupby(delivery_bins, observed=True)['rating'].mean()
+        top = analysis.top_restaurants(1).iloc[0]
+        
+        self.stats = {
+            'rows': rows,
+            'rating': profile['rating_stats'],
+            'rating_counts': profile['rating_counts'],
+            'cuisine_count': profile['cuisine_count'],
+            'cuisine_ratings': profile['cuisine_ratings'],
+            'city_count': profile['city_count'],
+            'city_ratings': profile['city_ratings'],
+            'price_count': profile['price_count'],
+            'price_ratings': profile['price_ratings'],
+            'price_stats': analysis.group_stats('price_range'),
+            'mean_price': profile['price_stats']['Mean Price'],
+            'correlation': analysis.correlation_analysis(),
+            'mean_reviews': df['num_reviews'].mean(),
+            'mean_delivery': df['delivery_time'].mean(),
+            'median_delivery': df['delivery_time'].median(),
+            'within_30': (df['delivery_time'] <= 30).mean(),
+            'mean_cost': df['cost_for_two'].mean(),
+            'cost_quartiles': df['cost_for_two'].quantile([0.25, 0.75]).to_numpy(),
+            'vegetarian': df['vegetarian'].mean(),
+            'online_delivery': df['has_online_delivery'].mean(),
+            'rating_by_delivery': rating_by_delivery,
+            'top_restaurant': (top['restaurant_name'], top['rating'], top['city'])
+        }
+        return self.stats
         
     def create_chart_1(self):
         """Rating Distribution Analysis"""
+        stats = self.collect_statistics()
+        rating = stats['rating']
+        counts = stats['rating_counts']
         self.add_chart_details(
             1,
             "Rating Distribution Analysis",
@@ -70,15 +145,18 @@ class ExcelChartsReport:
                 "Shows: Median, Q1, Q3, Whiskers, Outliers"
             ],
             [
-                "Average Rating: ~3.45 stars",
-                "Most Common Range: 3.0 - 4.5 stars",
-                "Distribution Shape: Near-normal distribution",
-                "Market shows diverse quality levels"
+                f"Average Rating: {rating['Mean Rating']:.2f} stars",
+                f"Median Rating: {rating['Median Rating']:.2f} stars (std dev {rating['Std Dev']:.2f})",
+                f"Range: {rating['Min Rating']:.1f} - {rating['Max Rating']:.1f} stars",
+                f"Most Common Rating: {counts.idxmax():.1f} ({counts.max():,} restaurants)"
             ]
         )
         
     def create_chart_2(self):
         """Cuisine Analysis"""
+        stats = self.collect_statistics()
+        counts = stats['cuisine_count']
+        ratings = stats['cuisine_ratings']
         self.add_chart_details(
             2,
             "Cuisine Analysis - Popularity & Ratings",
@@ -90,15 +168,18 @@ class ExcelChartsReport:
                 "Shows: Cuisine distribution and quality ranking"
             ],
             [
-                "Most Popular: North Indian (40% of market)",
-                "Highest Rated: Italian & Japanese (4.7-4.8 avg)",
-                "Most Competitive: Chinese & Continental",
-                "Opportunity in underserved high-quality cuisines"
+                f"Most Popular: {counts.index[0]} ({counts.iloc[0] / stats['rows']:.1%} of market)",
+                f"Highest Rated: {ratings.index[0]} ({ratings.iloc[0]:.2f} avg)",
+                f"Lowest Rated: {ratings.index[-1]} ({ratings.iloc[-1]:.2f} avg)",
+                f"{len(counts)} cuisines across {stats['rows']:,} restaurants"
             ]
         )
         
     def create_chart_3(self):
         """Price Range Distribution"""
+        stats = self.collect_statistics()
+        counts = stats['price_count']
+        ratings = stats['price_ratings']
         self.add_chart_details(
             3,
             "Price Range Distribution & Quality",
@@ -110,15 +191,18 @@ class ExcelChartsReport:
                 "Shows correlation between price and quality perception"
             ],
             [
-                "Price Range 2: Most popular (40% of restaurants)",
-                "Price Range 3: Highest average rating (4.4 stars)",
-                "Budget options maintain 4.0+ ratings",
-                "Sweet spot: Rs 1000-1500 price range"
+                f"Price Range {counts.idxmax()}: Most popular ({counts.max() / stats['rows']:.1%} of restaurants)",
+                f"Price Range {ratings.idxmax()}: Highest average rating ({ratings.max():.2f} stars)",
+                f"Price Range {ratings.idxmin()}: Lowest average rating ({ratings.min():.2f} stars)",
+                f"Mean price range: {stats['mean_price']:.2f}"
             ]
         )
         
     def create_chart_4(self):
         """Geographic Distribution"""
+        stats = self.collect_statistics()
+        counts = stats['city_count']
+        ratings = stats['city_ratings']
         self.add_chart_details(
             4,
             "Geographic Distribution & Ratings",
@@ -126,19 +210,24 @@ class ExcelChartsReport:
             [
                 "Left Panel: Bar Chart (Restaurants by City)",
                 "Right Panel: Bar Chart (Average Rating by City)",
-                "Cities: Mumbai, Delhi, Bangalore, Pune, Hyderabad",
+                f"Cities: {', '.join(map(str, counts.index))}",
                 "Shows: Market size and quality standards by location"
             ],
             [
-                "Mumbai: 250 restaurants (largest market)",
-                "Bangalore: 4.35 avg rating (highest quality)",
-                "Quality standards consistent across cities",
-                "Growth opportunity in tier-2 cities"
+                f"{counts.index[0]}: {counts.iloc[0]:,} restaurants (largest market)",
+                f"{ratings.index[0]}: {ratings.iloc[0]:.2f} avg rating (highest quality)",
+                f"{counts.index[-1]}: {counts.iloc[-1]:,} restaurants (smallest market)",
+                f"Average ratings across cities differ by {ratings.max() - ratings.min():.2f} stars"
             ]
         )
         
     def create_chart_5(self):
         """Correlation Heatmap"""
+        stats = self.collect_statistics()
+        corr = stats['correlation']
+        pairs = [(corr.iloc[i, j], corr.index[i], corr.columns[j])
+                 for i in range(len(corr)) for j in range(i + 1, len(corr))]
+        pairs.sort(key=lambda pair: -abs(pair[0]))
         self.add_chart_details(
             5,
             "Correlation Heatmap",
@@ -149,36 +238,44 @@ class ExcelChartsReport:
                 "Blue: Strong negative correlation (-1.0 to -0.3)",
                 "Shows: All numeric variable relationships"
             ],
-            [
-                "Ratings & Reviews: +0.65 (strong positive)",
-                "Rating & Price: +0.45 (moderate positive)",
-                "Rating & Delivery Time: -0.35 (weak negative)",
-                "More reviews = More polished restaurants"
-            ]
+            [f"{_label(a)} & {_label(b)}: {r:+.2f} ({_strength(r)} {'positive' if r >= 0 else 'negative'})"
+             for r, a, b in pairs[:4]]
         )
         
     def create_chart_6(self):
         """Additional Statistics"""
+        stats = self.collect_statistics()
+        low, high = stats['cost_quartiles']
         self.add_chart_details(
             6,
             "Additional Restaurant Statistics (2x2 Grid)",
             "Detailed analysis of delivery time, cost, vegetarian options, and online delivery availability.",
             [
-                "6.1 Delivery Time: Histogram (Mean: 28 min, Optimal: 25-32 min)",
-                "6.2 Cost for Two: Histogram (Budget: 20%, Standard: 35%, Premium: 30%, Luxury: 15%)",
-                "6.3 Vegetarian Options: Pie Chart (55% available, 45% not available)",
-                "6.4 Online Delivery: Pie Chart (70% available, 30% not available)"
+                f"6.1 Delivery Time: Histogram (Mean: {stats['mean_delivery']:.0f} min, "
+                f"Median: {stats['median_delivery']:.0f} min)",
+                f"6.2 Cost for Two: Histogram (Mean: Rs {stats['mean_cost']:.0f}, "
+                f"middle 50%: Rs {low:.0f}-{high:.0f})",
+                f"6.3 Vegetarian Options: Pie Chart ({stats['vegetarian']:.0%} available, "
+                f"{1 - stats['vegetarian']:.0%} not available)",
+                f"6.4 Online Delivery: Pie Chart ({stats['online_delivery']:.0%} available, "
+                f"{1 - stats['online_delivery']:.0%} not available)"
             ],
             [
-                "Most restaurants deliver within 30 minutes",
-                "Balanced distribution across all price tiers",
-                "Over 50% restaurants cater to vegetarian customers",
-                "Strong adoption of online platforms (70%)"
+                f"{stats['within_30']:.0%} of restaurants deliver within 30 minutes",
+                f"Average cost for two: Rs {stats['mean_cost']:.0f}",
+                f"{stats['vegetarian']:.0%} of restaurants cater to vegetarian customers",
+                f"Online delivery adoption: {stats['online_delivery']:.0%}"
             ]
         )
         
     def create_chart_7(self):
         """Advanced Metrics"""
+        stats = self.collect_statistics()
+        r = stats['correlation'].loc['num_reviews', 'rating']
+        by_delivery = stats['rating_by_delivery']
+        best_bin = by_delivery.idxmax()
+        name, rating, city = stats['top_restaurant']
+        price_std = stats['price_stats']['std']
         self.add_chart_details(
             7,
             "Advanced Restaurant Metrics (2x2 Grid)",
@@ -190,54 +287,163 @@ class ExcelChartsReport:
                 "7.4 Price vs Rating: Line plot with error bars (Standard deviation shown)"
             ],
             [
-                "Clear positive trend: More reviews = Higher ratings",
-                "Optimal delivery: 25-35 minutes = 4.42 stars",
-                "Biryani Palace: Highest rated (4.9 stars)",
-                "Premium restaurants most consistent in quality"
+                f"Reviews vs rating correlation: {r:+.2f} ({_strength(r)})",
+                f"Best delivery window: {best_bin.left:.0f}-{best_bin.right:.0f} minutes = "
+                f"{by_delivery.max():.2f} stars",
+                f"{name} ({city}): Highest rated ({rating:.1f} stars)",
+                f"Price range {price_std.idxmin()} most consistent in quality "
+                f"(std dev {price_std.min():.2f})"
             ]
         )
         
+    def _chart(self, kind, title, ws, data_col, first_row, last_row, x_title=None, y_title=None):
+        """Native chart over ``data_col`` of a table, categories from its first column"""
+        chart = kind()
+        chart.title = title
+        chart.add_data(Reference(ws, min_col=data_col, min_row=first_row - 1, max_row=last_row),
+                       titles_from_data=True)
+        chart.set_categories(Reference(ws, min_col=1, min_row=first_row, max_row=last_row))
+        if kind is not PieChart:
+            chart.legend = None
+            chart.x_axis.title = x_title
+            chart.y_axis.title = y_title
+            chart.x_axis.delete = False
+            chart.y_axis.delete = False
+        return chart
+        
+    def add_chart_sheet(self):
+        """Add a sheet of small aggregate tables with native Excel charts
+        
+        The charts reference the tables, so Excel draws them itself: no
+        matplotlib rendering and no embedded images, whatever the row count.
+        """
+        stats = self.collect_statistics()
+        ws = self.wb.create_sheet("Charts")
+        ws.column_dimensions['A'].width = 18
+        header_font = Font(bold=True, color="FFFFFF")
+        row = 1
+        
+        def table(title, headers, rows, charts):
+            nonlocal row
+            ws.append([self._cell(ws, title, Font(size=12, bold=True))])
+            ws.append([self._cell(ws, header, header_font, HEADER_FILLS[2]) for header in headers])
+            for values in rows:
+                ws.append(list(values))
+            first, last = row + 2, row + 1 + len(rows)
+            for column, chart in zip(('E', 'N'), charts(first, last)):
+                ws.add_chart(chart, f'{column}{row}')
+            used = 2 + len(rows)
+            block = max(CHART_BLOCK_ROWS, used + 2)
+            for _ in range(block - used):
+                ws.append([])
+            row += block
+        
+        # Binned rating histogram, with the bin edges the matplotlib chart uses
+        counts = stats['rating_counts']
+        values = counts.index.to_numpy(dtype=np.float64)
+        hist, edges = np.histogram(values, bins=np.histogram_bin_edges(values, bins=20),
+                                   weights=counts.to_numpy())
+        table("Rating Distribution", ["Rating", "Restaurants"],
+              [(f"{lo:.2f}-{hi:.2f}", int(n)) for lo, hi, n in zip(edges[:-1], edges[1:], hist)],
+              lambda first, last: [
+                  self._chart(BarChart, "Rating Distribution", ws, 2, first, last,
+                              "Rating", "Restaurants")])
+        
+        for name, label in (('cuisine', 'Cuisine'), ('city', 'City')):
+            counts = stats[f'{name}_count']
+            ratings = stats[f'{name}_ratings'].reindex(counts.index)
+            table(f"{label} Analysis", [label, "Restaurants", "Average Rating"],
+                  [(str(key), int(counts[key]), round(float(ratings[key]), 3)) for key in counts.index],
+                  lambda first, last, label=label: [
+                      self._chart(BarChart, f"Restaurants by {label}", ws, 2, first, last,
+                                  label, "Restaurants"),
+                      self._chart(BarChart, f"Average Rating by {label}", ws, 3, first, last,
+                                  label, "Average Rating")])
+        
+        counts = stats['price_count']
+        ratings = stats['price_ratings'].reindex(counts.index)
+        table("Price Range Analysis", ["Price Range", "Restaurants", "Average Rating"],
+              [(int(key), int(counts[key]), round(float(ratings[key]), 3)) for key in counts.index],
+              lambda first, last: [
+                  self._chart(PieChart, "Distribution by Price Range", ws, 2, first, last),
+                  self._chart(LineChart, "Average Rating by Price Range", ws, 3, first, last,
+                              "Price Range", "Average Rating")])
+        
     def add_summary_sheet(self):
         """Add summary statistics sheet"""
+        stats = self.collect_statistics()
         ws_summary = self.wb.create_sheet("Summary Statistics")
-        row = 1
         
         # Headers
         headers = ["Metric", "Value", "Description"]
-        for col, header in enumerate(headers, 1):
-            cell = ws_summary.cell(row=row, column=col)
-            cell.value = header
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
-        
-        row += 1
+        ws_summary.append([self._cell(ws_summary, header, Font(bold=True, color="FFFFFF"),
+                                      HEADER_FILLS[1]) for header in headers])
         
         # Data
+        price_share = stats['price_count'] / stats['rows']
         data = [
-            ["Total Restaurants", "50 (sample) / 1000 (full)", "Sample size for demonstration"],
-            ["Unique Cuisines", "15+ types", "Diverse cuisine options"],
-            ["Cities Covered", "5 major cities", "Mumbai, Delhi, Bangalore, Pune, Hyderabad"],
-            ["Average Rating", "4.3 stars", "Overall market quality"],
-            ["Average Reviews", "180 reviews", "Customer engagement"],
-            ["Average Delivery Time", "28 minutes", "Service efficiency"],
-            ["Average Cost for Two", "Rs 950", "Market pricing"],
-            ["Vegetarian Options", "55% availability", "Market requirement analysis"],
-            ["Online Delivery", "70% adoption", "Digital transformation"],
-            ["Price Range Distribution", "1:20% | 2:35% | 3:30% | 4:15%", "Market segmentation"]
+            ["Total Restaurants", f"{stats['rows']:,}", "Restaurants in the analysed data"],
+            ["Unique Cuisines", f"{len(stats['cuisine_count'])} types", "Diverse cuisine options"],
+            ["Cities Covered", f"{len(stats['city_count'])} cities",
+             ", ".join(map(str, stats['city_count'].index))],
+            ["Average Rating", f"{stats['rating']['Mean Rating']:.2f} stars", "Overall market quality"],
+            ["Average Reviews", f"{stats['mean_reviews']:.0f} reviews", "Customer engagement"],
+            ["Average Delivery Time", f"{stats['mean_delivery']:.0f} minutes", "Service efficiency"],
+            ["Average Cost for Two", f"Rs {stats['mean_cost']:.0f}", "Market pricing"],
+            ["Vegetarian Options", f"{stats['vegetarian']:.0%} availability", "Market requirement analysis"],
+            ["Online Delivery", f"{stats['online_delivery']:.0%} adoption", "Digital transformation"],
+            ["Price Range Distribution",
+             " | ".join(f"{price}:{share:.0%}" for price, share in price_share.items()),
+             "Market segmentation"]
         ]
         
         for data_row in data:
-            for col, value in enumerate(data_row, 1):
-                cell = ws_summary.cell(row=row, column=col)
-                cell.value = value
-                cell.alignment = Alignment(wrap_text=True)
-            row += 1
-            
-    def create_report(self, filename="Restaurant_Charts_Report.xlsx"):
+            ws_summary.append([self._cell(ws_summary, value, wrap=True) for value in data_row])
+        
+    def add_detail_sheets(self, rows_per_sheet=MAX_SHEET_ROWS - 1, chunksize=10_000):
+        """Stream every restaurant row into "Restaurant Details" sheets
+        
+        Rows are appended chunk by chunk and written straight to disk; a new
+        sheet ("Restaurant Details (2)", ...) starts whenever the current one
+        holds ``rows_per_sheet`` data rows below its header.
+        """
+        df = self.analysis.df
+        columns = list(df.columns)
+        # float32 values become Python floats such as 4.400000095367432
+        narrow = {col: 'float64' for col in columns if df[col].dtype == 'float32'}
+        header_font = Font(bold=True, color="FFFFFF")
+        sheets = []
+        ws = None
+        sheet_rows = rows_per_sheet
+        
+        for start in range(0, len(df), chunksize):
+            chunk = df.iloc[start:start + chunksize]
+            if narrow:
+                chunk = chunk.astype(narrow).round({col: 1 for col in narrow})
+            chunk = chunk.astype(object)
+            values = chunk.where(chunk.notna(), None).to_numpy().tolist()
+            while values:
+                if sheet_rows == rows_per_sheet:
+                    title = "Restaurant Details"
+                    if sheets:
+                        title += f" ({len(sheets) + 1})"
+                    ws = self.wb.create_sheet(title)
+                    ws.append([self._cell(ws, _label(col), header_font, HEADER_FILLS[1])
+                               for col in columns])
+                    sheets.append(title)
+                    sheet_rows = 0
+                take = min(rows_per_sheet - sheet_rows, len(values))
+                for row in values[:take]:
+                    ws.append(row)
+                sheet_rows += take
+                values = values[take:]
+        return sheets
+        
+    def create_report(self, filename="Restaurant_Charts_Report.xlsx", details=True, charts=True):
         """Create complete Excel report"""
         self.add_header("ZOMATO/SWIGGY RESTAURANT ANALYSIS")
         self.add_header("Complete Charts Documentation with Details", level=2)
-        self.row += 1
+        self.ws.append([])
         
         # Add all charts
         self.create_chart_1()
@@ -248,9 +454,17 @@ class ExcelChartsReport:
         self.create_chart_6()
         self.create_chart_7()
         
+        # Add native charts over aggregate tables
+        if charts:
+            self.add_chart_sheet()
+        
         # Add summary sheet
         self.add_summary_sheet()
         
+        # Add per-restaurant rows
+        if details:
+            self.add_detail_sheets()
+        
         # Save the workbook
         self.wb.save(filename)
         print(f"Excel report created: {filename}")
@@ -259,5 +473,24 @@ class ExcelChartsReport:
 
 
 if __name__ == "__main__":
-    report = ExcelChartsReport()
-    report.create_report("Restaurant_Analysis_Charts_Report.xlsx")
+    parser = argparse.ArgumentParser(description="Excel report of the restaurant analysis")
+    parser.add_argument('--data', help="data file or partition directory (default: 1000 sample rows)")
+    parser.add_argument('--output', default="Restaurant_Analysis_Charts_Report.xlsx",
+                        help="workbook to write")
+    parser.add_argument('--no-details', action='store_true',
+                        help="skip the per-restaurant detail sheets")
+    parser.add_argument('--no-charts', action='store_true',
+                        help="skip the sheet of native Excel charts")
+    args = parser.parse_args()
+
+    analysis = RestaurantAnalysis()
+    if args.data:
+        analysis.load_data(args.data)
+    else:
+        from generate_sample_data import RestaurantDataGenerator
+        analysis.df = RestaurantDataGenerator().generate_sample_data(num_records=1000)
+    if analysis.df is None:
+        sys.exit(1)
+
+    report = ExcelChartsReport(analysis)
+    report.create_report(args.output, details=not args.no_details, charts=not args.no_charts)
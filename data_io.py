@@ -0,0 +1,182 @@
+import os
+import glob
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+# Text columns stored dictionary-encoded in columnar formats
+CATEGORICAL_COLUMNS = ['restaurant_name', 'cuisine', 'city']
+
+# Declared dtypes for restaurant data. The integer columns have small known
+# ranges, so narrow types hold them exactly. Ratings stay float64: float32
+# cannot represent one-decimal values exactly and 4.4 would surface as
+# 4.400000095367432 in every mean, report and response. Fixed-point int16
+# tenths would be exact, but every consumer of the rating column would have
+# to decode it. The cost is a total reduction of about 4.2x against inferred
+# dtypes (rating is a third of the loaded bytes) rather than the ~5.6x int16
+# tenths would reach.
+SCHEMA = {
+    'restaurant_id': 'int32',
+    'restaurant_name': 'category',
+    'cuisine': 'category',
+    'rating': 'float64',
+    'num_reviews': 'int16',
+    'price_range': 'int8',
+    'delivery_time': 'int16',
+    'cost_for_two': 'int16',
+    'city': 'category',
+    'vegetarian': 'bool',
+    'has_online_delivery': 'bool'
+}
+
+
+def is_url(path):
+    """True for ``http://`` and ``https://`` feed locations"""
+    return str(path).startswith(('http://', 'https://'))
+
+
+def file_format(path):
+    """Return 'parquet', 'feather' or 'csv' based on the file extension"""
+    ext = os.path.splitext(str(path))[1].lower()
+    if ext in ('.parquet', '.pq'):
+        return 'parquet'
+    if ext in ('.feather', '.arrow'):
+        return 'feather'
+    return 'csv'
+
+
+def partition_files(path):
+    """List the ``part-*`` files of a partitioned dataset directory in order"""
+    return sorted(glob.glob(os.path.join(path, 'part-*')))
+
+
+def write_frame(df, path):
+    """Write a DataFrame in the format implied by ``path``
+
+    Parquet and Feather keep dtypes and store the text columns as
+    dictionary-encoded categoricals.
+    """
+    fmt = file_format(path)
+    if fmt == 'csv':
+        df.to_csv(path, index=False)
+        return
+
+    df = df.astype({col: 'category' for col in CATEGORICAL_COLUMNS
+                    if col in df.columns
+                    and not isinstance(df[col].dtype, pd.CategoricalDtype)})
+    if fmt == 'parquet':
+        df.to_parquet(path, index=False)
+    else:
+        df.reset_index(drop=True).to_feather(path)
+
+
+def concat_frames(frames):
+    """Concatenate frames, keeping columns that are categorical in all of them categorical
+
+    ``pd.concat`` falls back to object columns when the category sets of
+    the frames differ, so the categories are unioned (sorted, as
+    ``astype('category')`` would give) before concatenating.
+    """
+    categorical = [col for col in frames[0].columns
+                   if all(isinstance(frame[col].dtype, pd.CategoricalDtype) for frame in frames)]
+    if len(frames) > 1 and categorical:
+        categories = {col: union_categoricals([frame[col] for frame in frames],
+                                              sort_categories=True).categories
+                      for col in categorical}
+        frames = [frame.assign(**{col: frame[col].cat.set_categories(categories[col])
+                                  for col in categorical})
+                  for frame in frames]
+    return pd.concat(frames, ignore_index=True)
+
+
+def read_frame(path, columns=None, dtype=None):
+    """Read a file or partitioned directory, optionally projecting ``columns``
+
+    Columnar formats only read the requested columns from disk. ``dtype``
+    maps column names to dtypes (e.g. ``SCHEMA``); columns not present in the
+    data are ignored. An ``http(s)://`` path is read as a paged JSON feed
+    (see ``http_source``).
+    """
+    if is_url(path):
+        from http_source import read_http
+        return read_http(path, columns, dtype)
+
+    if os.path.isdir(path):
+        parts = [read_frame(part, columns, dtype) for part in partition_files(path)]
+        return concat_frames(parts)
+
+    fmt = file_format(path)
+    if fmt == 'parquet':
+        df = pd.read_parquet(path, columns=columns)
+    elif fmt == 'feather':
+        df = pd.read_feather(path, columns=columns)
+    else:
+        return pd.read_csv(path, usecols=columns, dtype=dtype)
+
+    if dtype:
+        df = apply_dtypes(df, dtype)
+    return df
+
+
+def apply_dtypes(df, dtype):
+    """Cast the columns of ``df`` named in ``dtype``, ignoring the others
+
+    float32 columns widened to float64 (e.g. ratings in files written with an
+    older schema) go through their shortest decimal form, so a stored 4.4
+    becomes 4.4 rather than 4.400000095367432.
+    """
+    dtype = {col: t for col, t in dtype.items() if col in df.columns}
+    for col, t in dtype.items():
+        if df[col].dtype == 'float32' and t == 'float64':
+            df[col] = df[col].to_numpy().astype(str).astype('float64')
+    return df.astype(dtype)
+
+
+def inferred_nbytes(series, sample_size=100_000):
+    """Estimate the bytes ``series`` would take if pandas inferred its dtype
+
+    Rebuilds up to ``sample_size`` values from plain Python objects, lets
+    pandas infer their dtype and scales the measured size to the full length.
+    """
+    if len(series) == 0:
+        return 0
+    sample = series.iloc[:sample_size]
+    inferred = pd.Series(sample.to_numpy(dtype=object).tolist())
+    nbytes = inferred.memory_usage(deep=True, index=False)
+    return int(round(nbytes * len(series) / len(sample)))
+
+
+def iter_frames(path, columns=None, dtype=None, chunksize=1_000_000):
+    """Yield a file or partitioned directory as DataFrames of ``chunksize`` rows
+
+    Only one chunk is held in memory at a time. Parquet is read batch by
+    batch and Feather through a memory map. Feeds (``http(s)://`` paths) are
+    yielded page by page.
+    """
+    if is_url(path):
+        from http_source import iter_pages
+        yield from iter_pages(path, columns, dtype)
+        return
+
+    if os.path.isdir(path):
+        for part in partition_files(path):
+            yield from iter_frames(part, columns, dtype, chunksize)
+        return
+
+    fmt = file_format(path)
+    if fmt == 'csv':
+        yield from pd.read_csv(path, usecols=columns, dtype=dtype, chunksize=chunksize)
+        return
+
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+        batches = pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns)
+    else:
+        import pyarrow.feather as feather
+        table = feather.read_table(path, columns=columns, memory_map=True)
+        batches = table.to_batches(max_chunksize=chunksize)
+
+    for batch in batches:
+        df = batch.to_pandas()
+        if dtype:
+            df = apply_dtypes(df, dtype)
+        yield df
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the paginated restaurant feed
+
+Serves generated restaurant data in the page format ``http_source`` reads,
+optionally failing a share of requests with 503 or delaying each page, so
+ingestion (concurrency, retries, typing) can be exercised offline.
+
+Usage:
+    python feed_server.py --records 100000 --port 8766 --fail-rate 0.1
+    python http_source.py http://127.0.0.1:8766/restaurants --output data_parts
+"""
+
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+from generate_sample_data import RestaurantDataGenerator
+
+
+class FeedServer(ThreadingHTTPServer):
+    """Threaded HTTP server paging through one DataFrame
+
+    ``rows=True`` serves row-oriented ``records`` pages instead of columns.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, df, fail_rate=0.0, delay=0.0, rows=False, seed=0):
+        super().__init__(address, FeedHandler)
+        self.df = df
+        self.fail_rate = fail_rate
+        self.delay = delay
+        self.rows = rows
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+
+    def page(self, page, page_size):
+        """Payload for one 1-based page"""
+        chunk = self.df.iloc[(page - 1) * page_size:page * page_size]
+        payload = {'page': page, 'pages': -(-len(self.df) // page_size), 'total': len(self.df)}
+        if self.rows:
+            payload['records'] = chunk.to_dict(orient='records')
+        else:
+            payload['columns'] = {col: chunk[col].tolist() for col in chunk.columns}
+        return payload
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            fail = server.random.random() < server.fail_rate
+            server.failures += fail
+        if server.delay:
+            time.sleep(server.delay)
+
+        params = parse_qs(urlsplit(self.path).query)
+        try:
+            page = int(params.get('page', ['1'])[0])
+            page_size = int(params.get('page_size', ['10000'])[0])
+        except ValueError:
+            return self.reply(400, {'error': 'page and page_size must be integers'})
+        if fail:
+            return self.reply(503, {'error': 'Injected failure'})
+        self.reply(200, server.page(page, page_size))
+
+    def reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stand-in paginated restaurant feed")
+    parser.add_argument('--records', type=int, default=100_000, help="rows to serve")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--fail-rate', type=float, default=0.0,
+                        help="share of requests answered with 503")
+    parser.add_argument('--delay', type=float, default=0.0, help="seconds to wait per request")
+    parser.add_argument('--rows', action='store_true', help="serve row-oriented records pages")
+    args = parser.parse_args(argv)
+
+    df = RestaurantDataGenerator().generate_sample_data(num_records=args.records, vectorized=True)
+    server = FeedServer((args.host, args.port), df, args.fail_rate, args.delay, args.rows)
+    print(f"Serving {len(df):,} restaurants on http://{args.host}:{args.port}/restaurants", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nStopped after {server.requests} requests ({server.failures} failed)")
+
+
+if __name__ == "__main__":
+    main()
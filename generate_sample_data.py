@@ -2,6 +2,9 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import random
+import os
+from concurrent.futures import ProcessPoolExecutor
+from data_io import write_frame
 
 class RestaurantDataGenerator:
     """Generate sample restaurant data for analysis"""
@@ -17,9 +20,21 @@ class RestaurantDataGenerator:
             'Curry King', 'Wok Express', 'The Good Fork', 'Samosa Junction',
             'Biryani Palace', 'Tandoori Nights', 'Sweet Escapes'
         ]
+        
+        self.cities = ['Mumbai', 'Delhi', 'Bangalore', 'Pune', 'Hyderabad']
     
-    def generate_sample_data(self, num_records=1000, seed=42):
-        """Generate synthetic restaurant data"""
+    def generate_sample_data(self, num_records=1000, seed=42, vectorized=False):
+        """Generate synthetic restaurant data
+        
+        With ``vectorized=True`` the frame is assembled from
+        ``generate_chunks`` instead of per-row ``random.choice`` calls.
+        """
+        if vectorized:
+            chunks = list(self.generate_chunks(num_records, seed=seed))
+            if not chunks:
+                return self._generate_chunk(0, 0, seed, 0)
+            return pd.concat(chunks, ignore_index=True)
+        
         np.random.seed(seed)
         random.seed(seed)
         
@@ -32,8 +47,7 @@ class RestaurantDataGenerator:
             'price_range': np.random.randint(1, 5, num_records),
             'delivery_time': np.random.randint(15, 60, num_records),
             'cost_for_two': np.random.randint(200, 2000, num_records),
-            'city': [random.choice(['Mumbai', 'Delhi', 'Bangalore', 'Pune', 'Hyderabad']) 
-                    for _ in range(num_records)],
+            'city': [random.choice(self.cities) for _ in range(num_records)],
             'vegetarian': [random.choice([True, False]) for _ in range(num_records)],
             'has_online_delivery': [random.choice([True, False]) for _ in range(num_records)]
         }
@@ -47,14 +61,117 @@ class RestaurantDataGenerator:
         
         return df
     
+    def generate_chunks(self, num_records=1000, chunk_size=1_000_000, seed=42):
+        """Yield synthetic restaurant data as DataFrames of ``chunk_size`` rows
+        
+        Every chunk draws from its own ``numpy.random.Generator`` spawned from
+        ``seed`` and the chunk index, so a given ``seed`` and ``chunk_size``
+        always produce the same rows and only one chunk is held in memory.
+        Text columns are built directly from category codes.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        for index, start in enumerate(range(0, num_records, chunk_size)):
+            size = min(chunk_size, num_records - start)
+            yield self._generate_chunk(start, size, seed, index)
+    
+    def _generate_chunk(self, start, size, seed, index):
+        """Generate one chunk of rows with ids ``start + 1 .. start + size``"""
+        rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(index,)))
+        
+        def categorical(values):
+            codes = rng.integers(0, len(values), size, dtype=np.int8)
+            return pd.Categorical.from_codes(codes, categories=values)
+        
+        restaurant_name = categorical(self.restaurants)
+        cuisine = categorical(self.cuisines)
+        rating = np.round(rng.uniform(2.0, 5.0, size), 1)
+        num_reviews = rng.integers(10, 500, size)
+        price_range = rng.integers(1, 5, size)
+        delivery_time = rng.integers(15, 60, size)
+        cost_for_two = rng.integers(200, 2000, size)
+        city = categorical(self.cities)
+        vegetarian = rng.integers(0, 2, size, dtype=np.int8).astype(bool)
+        has_online_delivery = rng.integers(0, 2, size, dtype=np.int8).astype(bool)
+        
+        # Same rating/review correlation as generate_sample_data
+        rating = np.round(np.clip(rating + (num_reviews / 100) * 0.1, 1.0, 5.0), 1)
+        
+        return pd.DataFrame({
+            'restaurant_id': np.arange(start + 1, start + size + 1),
+            'restaurant_name': restaurant_name,
+            'cuisine': cuisine,
+            'rating': rating,
+            'num_reviews': num_reviews,
+            'price_range': price_range,
+            'delivery_time': delivery_time,
+            'cost_for_two': cost_for_two,
+            'city': city,
+            'vegetarian': vegetarian,
+            'has_online_delivery': has_online_delivery
+        })
+    
+    def save_chunks(self, chunks, filename='restaurant_data.csv'):
+        """Stream DataFrame chunks to a single CSV without concatenating them"""
+        rows = 0
+        columns = 0
+        with open(filename, 'w', newline='') as f:
+            for df in chunks:
+                df.to_csv(f, index=False, header=rows == 0)
+                rows += len(df)
+                columns = df.shape[1]
+        print(f"Data saved to {filename}")
+        print(f"Shape: {(rows, columns)}")
+    
+    def generate_partitioned(self, num_records, output_dir, seed=42,
+                             chunk_size=1_000_000, n_jobs=None, file_format='csv'):
+        """Generate data in parallel, one output partition per shard
+        
+        ``num_records`` is split into shards of ``chunk_size`` rows and each
+        shard is written by a worker process to ``part-NNNNN.<file_format>``
+        in ``output_dir``. Shards use the same per-chunk seed streams as
+        ``generate_chunks``, so the partitions are identical for any
+        ``n_jobs`` and concatenate to the same rows, with contiguous
+        ``restaurant_id`` values across partitions.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        os.makedirs(output_dir, exist_ok=True)
+        tasks = [
+            (start, min(chunk_size, num_records - start), seed, index,
+             os.path.join(output_dir, f'part-{index:05d}.{file_format}'))
+            for index, start in enumerate(range(0, num_records, chunk_size))
+        ]
+        
+        if n_jobs == 1 or len(tasks) <= 1:
+            written = [_write_partition(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                written = list(executor.map(_write_partition, tasks))
+        
+        paths = [path for path, _ in written]
+        rows = sum(shape[0] for _, shape in written)
+        columns = written[0][1][1] if written else 0
+        print(f"Data saved to {output_dir} ({len(paths)} partitions)")
+        print(f"Shape: {(rows, columns)}")
+        return paths
+    
     def save_data(self, df, filename='restaurant_data.csv'):
-        """Save data to CSV"""
-        df.to_csv(filename, index=False)
+        """Save data to CSV, or to Parquet/Feather by file extension"""
+        write_frame(df, filename)
         print(f"Data saved to {filename}")
         print(f"Shape: {df.shape}")
         print(f"\nFirst few rows:\n{df.head()}")
 
 
+def _write_partition(task):
+    """Worker entry point: generate one shard, write it and return (path, shape)"""
+    start, size, seed, index, path = task
+    df = RestaurantDataGenerator()._generate_chunk(start, size, seed, index)
+    write_frame(df, path)
+    return path, df.shape
+
+
 if __name__ == "__main__":
     generator = RestaurantDataGenerator()
     df = generator.generate_sample_data(num_records=1000)
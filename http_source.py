@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Paged ingestion of restaurant data from an HTTP JSON feed
+
+The feed answers ``GET <url>?page=N&page_size=M`` (pages start at 1) with::
+
+    {"page": 1, "pages": 42, "total": 415000,
+     "columns": {"restaurant_id": [...], "rating": [...], ...}}
+
+Column-oriented pages are turned into typed arrays directly, without a
+per-row dict. Row-oriented pages (``"records": [{...}, ...]``) are accepted
+too, but JSON decoding then creates a dict per row.
+
+Usage:
+    python http_source.py http://127.0.0.1:8766/restaurants --output data_parts --format parquet
+"""
+
+import os
+import sys
+import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from data_io import SCHEMA, write_frame, concat_frames
+
+# Statuses worth retrying: throttling and transient server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def pooled_session(max_workers=8, retries=3, backoff=0.5):
+    """``requests.Session`` with one keep-alive connection per worker and retries
+
+    Failed GETs (connection errors and ``RETRY_STATUSES``) are retried up to
+    ``retries`` times, sleeping ``backoff * 2**attempt`` seconds in between.
+    """
+    session = requests.Session()
+    retry = Retry(total=retries, backoff_factor=backoff, status_forcelist=RETRY_STATUSES,
+                  allowed_methods=frozenset(['GET']))
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _nullable(dtype):
+    """pandas nullable counterpart of a numpy bool or integer dtype, e.g. Int16"""
+    if dtype.kind == 'b':
+        return 'boolean'
+    return dtype.name.replace('uint', 'UInt').replace('int', 'Int')
+
+
+def typed_array(col, values, target):
+    """``values`` of column ``col`` as an array of numpy dtype ``target``
+
+    Nulls in a bool or integer column give its nullable dtype (e.g. Int16)
+    and nulls in a float column NaN. A value that is not a number, or that
+    ``target`` cannot hold without wrapping or truncating, raises ValueError.
+    """
+    target = np.dtype(target)
+    array = np.asarray(values)
+    if array.dtype.kind not in 'biuf':
+        try:
+            array = pd.to_numeric(pd.Series(values, dtype=object)).to_numpy()
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Column '{col}' has non-numeric values: {e}") from None
+    if target.kind == 'f':
+        return array.astype(target)
+
+    missing = np.isnan(array) if array.dtype.kind == 'f' else None
+    present = array[~missing] if missing is not None else array
+    if len(present):
+        if target.kind == 'b':
+            low, high = 0, 1
+        else:
+            info = np.iinfo(target)
+            low, high = info.min, info.max
+        if present.min() < low or present.max() > high:
+            raise ValueError(f"Column '{col}' has values between {present.min()} and "
+                             f"{present.max()}, outside the range of {target}")
+        if present.dtype.kind == 'f' and (present % 1).any():
+            raise ValueError(f"Column '{col}' has fractional values, expected {target}")
+    if missing is not None and missing.any():
+        return pd.array(array, dtype=_nullable(target))
+    return array.astype(target)
+
+
+def page_frame(payload, columns=None, dtype=None):
+    """Typed DataFrame from one decoded page
+
+    Each requested column goes straight from its JSON list to a numpy array
+    (or Categorical) of the ``dtype`` declared for it; see ``typed_array``
+    for how nulls and values out of range are handled.
+    """
+    if 'columns' in payload:
+        data = payload['columns']
+    else:
+        data = pd.DataFrame.from_records(payload.get('records', []))
+    names = [col for col in (columns or data.keys()) if col in data]
+
+    arrays = {}
+    for col in names:
+        target = (dtype or {}).get(col)
+        if target == 'category':
+            arrays[col] = pd.Categorical(data[col])
+        elif target is not None:
+            arrays[col] = typed_array(col, data[col], target)
+        else:
+            arrays[col] = data[col]
+    return pd.DataFrame(arrays)
+
+
+def fetch_page(session, url, page, page_size, timeout=30):
+    """Decoded JSON of one page"""
+    response = session.get(url, params={'page': page, 'page_size': page_size}, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+def iter_pages(url, columns=None, dtype=SCHEMA, page_size=10_000, max_workers=8,
+               retries=3, backoff=0.5, timeout=30, session=None):
+    """Yield the feed as typed DataFrames, one per page, in page order
+
+    The first page gives the page count; the rest are fetched and converted
+    by ``max_workers`` threads sharing one pooled session. At most
+    ``2 * max_workers`` pages are in flight or waiting to be consumed, so
+    memory stays bounded however long the feed is.
+    """
+    session = session or pooled_session(max_workers, retries, backoff)
+    first = fetch_page(session, url, 1, page_size, timeout)
+    yield page_frame(first, columns, dtype)
+
+    def fetch_frame(page):
+        return page_frame(fetch_page(session, url, page, page_size, timeout), columns, dtype)
+
+    pages = first['pages']
+    next_page = 2
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            while next_page <= pages or pending:
+                while next_page <= pages and len(pending) < 2 * max_workers:
+                    pending.append(executor.submit(fetch_frame, next_page))
+                    next_page += 1
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def read_http(url, columns=None, dtype=SCHEMA, **options):
+    """Read the whole feed into one typed DataFrame"""
+    return concat_frames(list(iter_pages(url, columns, dtype, **options)))
+
+
+def write_http(url, output_dir, file_format='parquet', columns=None, dtype=SCHEMA, **options):
+    """Write the feed to a partitioned dataset directory, one part per page
+
+    The directory can be read back with ``data_io.read_frame`` or
+    ``RestaurantAnalysis.load_data``. Returns the written paths.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for index, frame in enumerate(iter_pages(url, columns, dtype, **options)):
+        path = os.path.join(output_dir, f'part-{index:05d}.{file_format}')
+        write_frame(frame, path)
+        paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ingest a paged restaurant JSON feed")
+    parser.add_argument('url', help="feed URL")
+    parser.add_argument('--output', required=True, help="partitioned dataset directory to write")
+    parser.add_argument('--format', default='parquet', choices=['csv', 'parquet', 'feather'])
+    parser.add_argument('--page-size', type=int, default=10_000)
+    parser.add_argument('--workers', type=int, default=8, help="concurrent page requests")
+    parser.add_argument('--retries', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    try:
+        paths = write_http(args.url, args.output, args.format, page_size=args.page_size,
+                           max_workers=args.workers, retries=args.retries)
+    except (requests.RequestException, ValueError) as e:
+        print(f"Error ingesting feed: {e}")
+        return 1
+    print(f"Wrote {len(paths)} partitions to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
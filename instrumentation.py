@@ -0,0 +1,170 @@
+import os
+import sys
+import json
+import time
+import inspect
+import cProfile
+import functools
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+import pandas as pd
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def _rss_peak_mb():
+    """Peak resident set size of this process so far, in MB"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+
+def _frame_rows(obj):
+    """Rows of the frame an analysis/visualization object holds, without loading it"""
+    attrs = getattr(obj, '__dict__', {})
+    for name in ('_df', 'df'):
+        if isinstance(attrs.get(name), pd.DataFrame):
+            return len(attrs[name])
+    return None
+
+
+class Instrumentation:
+    """Wall time, CPU time, peak memory and row counts per pipeline stage
+
+    Wrap a stage in ``with hooks.stage(name) as record:`` and optionally set
+    ``record['rows']``; ``instrument(cls)`` reports every public method of a
+    class the same way, nested under the stage that called it. Peak memory
+    is the tracemalloc high-water mark above the stage's starting allocation
+    plus the process RSS peak; tracing slows allocation-heavy code, so pass
+    ``trace_memory=False`` when only timings matter. With ``profile_dir``
+    each top-level stage is also run under cProfile and dumped to
+    ``<profile_dir>/<NN>-<stage>.prof``.
+
+    A disabled instance patches nothing and its stages are empty contexts,
+    so leaving the hooks in place costs nothing.
+    """
+
+    def __init__(self, enabled=True, metrics_path=None, profile_dir=None, echo=True,
+                 trace_memory=True):
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.metrics_path = metrics_path
+        self.profile_dir = profile_dir
+        self.echo = echo
+        self.records = []
+        self._stack = []
+        self._patched = []
+        self._profiled = 0
+        self._started_tracing = False
+        if enabled:
+            if profile_dir:
+                os.makedirs(profile_dir, exist_ok=True)
+            if trace_memory and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+
+    def stage(self, name, rows=None):
+        """Context manager measuring one stage; yields its metrics record"""
+        if not self.enabled:
+            return nullcontext({})
+        return self._measure(name, rows)
+
+    def _traced(self):
+        """(current, peak) traced bytes, or zeros when memory is not traced"""
+        return tracemalloc.get_traced_memory() if self.trace_memory else (0, 0)
+
+    @contextmanager
+    def _measure(self, name, rows):
+        if self._stack:
+            parent = self._stack[-1]
+            parent['peak'] = max(parent['peak'], self._traced()[1])
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        current = self._traced()[0]
+        frame = {'start': current, 'peak': current}
+
+        record = {'stage': name, 'depth': len(self._stack), 'rows': rows}
+        self.records.append(record)
+        self._stack.append(frame)
+
+        profiler = None
+        if self.profile_dir and record['depth'] == 0:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield record
+        finally:
+            record['wall_s'] = time.perf_counter() - wall
+            record['cpu_s'] = time.process_time() - cpu
+            if profiler is not None:
+                profiler.disable()
+                self._profiled += 1
+                profiler.dump_stats(os.path.join(self.profile_dir, f'{self._profiled:02d}-{name}.prof'))
+
+            frame['peak'] = max(frame['peak'], self._traced()[1])
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1]['peak'] = max(self._stack[-1]['peak'], frame['peak'])
+            record['peak_alloc_mb'] = ((frame['peak'] - frame['start']) / 1024 ** 2
+                                       if self.trace_memory else None)
+            record['rss_peak_mb'] = _rss_peak_mb()
+            if self.echo and not self.metrics_path:
+                print(self.format(record))
+
+    def instrument(self, cls):
+        """Report every public method of ``cls`` as a stage until ``close()``"""
+        if not self.enabled:
+            return cls
+        names = {name for klass in cls.__mro__[:-1] for name in vars(klass)
+                 if not name.startswith('_')}
+        for name in sorted(names):
+            static = inspect.getattr_static(cls, name)
+            if isinstance(static, (staticmethod, classmethod, property)) or not callable(static):
+                continue
+            self._patched.append((cls, name, vars(cls).get(name)))
+            setattr(cls, name, self._wrap(cls.__name__, name, static))
+        return cls
+
+    def _wrap(self, owner, name, method):
+        @functools.wraps(method)
+        def wrapper(obj, *args, **kwargs):
+            with self.stage(f'{owner}.{name}') as record:
+                result = method(obj, *args, **kwargs)
+                record['rows'] = _frame_rows(obj)
+            return result
+        return wrapper
+
+    @staticmethod
+    def format(record):
+        """One stdout line for a stage record"""
+        line = (f"[metrics] {'  ' * record['depth']}{record['stage']}: "
+                f"wall {record['wall_s']:.3f}s, cpu {record['cpu_s']:.3f}s")
+        if record['peak_alloc_mb'] is not None:
+            line += f", peak {record['peak_alloc_mb']:.1f} MB"
+        if record['rss_peak_mb'] is not None:
+            line += f", rss {record['rss_peak_mb']:.1f} MB"
+        if record['rows'] is not None:
+            line += f", rows {record['rows']}"
+        return line
+
+    def close(self):
+        """Undo ``instrument`` patches and write the JSON metrics file"""
+        for cls, name, original in reversed(self._patched):
+            if original is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+        self._patched = []
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        if self.enabled and self.metrics_path:
+            with open(self.metrics_path, 'w') as f:
+                json.dump({'stages': self.records}, f, indent=2)
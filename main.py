@@ -5,14 +5,44 @@ This script shows how to use all the modules together
 """
 
 import sys
+import argparse
 from generate_sample_data import RestaurantDataGenerator
 from restaurant_analysis import RestaurantAnalysis
-from visualizations import RestaurantVisualizations
+from instrumentation import Instrumentation
 
 
-def main():
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Zomato/Swiggy Restaurant Analysis")
+    parser.add_argument('--cache-dir', default='.restaurant_cache',
+                        help="directory for cached analysis results")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="recompute every analysis, ignoring cached results")
+    parser.add_argument('--metrics', nargs='?', const='-', metavar='PATH',
+                        help="record time and memory per stage and method; "
+                             "print them, or write JSON to PATH")
+    parser.add_argument('--profile', nargs='?', const='profiles', metavar='DIR',
+                        help="also dump a cProfile file per stage into DIR (default: profiles)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Main execution function"""
-    
+    args = parse_args(argv)
+    hooks = Instrumentation(enabled=bool(args.metrics or args.profile),
+                            metrics_path=None if args.metrics in (None, '-') else args.metrics,
+                            profile_dir=args.profile)
+    hooks.instrument(RestaurantAnalysis)
+    try:
+        run_pipeline(args, hooks)
+    finally:
+        hooks.close()
+    if hooks.metrics_path:
+        print(f"Metrics written to {hooks.metrics_path}")
+
+
+def run_pipeline(args, hooks):
+    """Run the five pipeline steps, reporting each one into ``hooks``"""
     print("\n" + "="*70)
     print("ZOMATO/SWIGGY RESTAURANT ANALYSIS SYSTEM")
     print("="*70)
@@ -20,13 +50,15 @@ def main():
     # Step 1: Generate sample data
     print("\n[Step 1] Generating sample restaurant data...")
     try:
-        generator = RestaurantDataGenerator()
-        df = generator.generate_sample_data(num_records=1000)
-        generator.save_data(df, 'restaurant_data.csv')
-        print(f"✓ Sample data generated successfully")
-        print(f"  Total records: {len(df)}")
-        print(f"  Cuisines: {df['cuisine'].nunique()}")
-        print(f"  Cities: {df['city'].nunique()}")
+        with hooks.stage('generate') as stage:
+            generator = RestaurantDataGenerator()
+            df = generator.generate_sample_data(num_records=1000)
+            stage['rows'] = len(df)
+            generator.save_data(df, 'restaurant_data.csv')
+            print(f"✓ Sample data generated successfully")
+            print(f"  Total records: {len(df)}")
+            print(f"  Cuisines: {df['cuisine'].nunique()}")
+            print(f"  Cities: {df['city'].nunique()}")
     except Exception as e:
         print(f"✗ Error generating data: {e}")
         return
@@ -34,8 +66,11 @@ def main():
     # Step 2: Load and analyze data
     print("\n[Step 2] Loading and analyzing data...")
     try:
-        analysis = RestaurantAnalysis(data_path='restaurant_data.csv')
-        print("✓ Data loaded successfully")
+        with hooks.stage('load'):
+            analysis = RestaurantAnalysis(data_path='restaurant_data.csv',
+                                          cache_dir=args.cache_dir,
+                                          use_cache=not args.no_cache)
+            print("✓ Data loaded successfully")
     except Exception as e:
         print(f"✗ Error loading data: {e}")
         return
@@ -43,8 +78,9 @@ def main():
     # Step 3: Generate analysis report
     print("\n[Step 3] Generating analysis report...")
     try:
-        analysis.generate_report()
-        print("\n✓ Analysis report generated")
+        with hooks.stage('report'):
+            analysis.generate_report()
+            print("\n✓ Analysis report generated")
     except Exception as e:
         print(f"✗ Error generating report: {e}")
         return
@@ -52,28 +88,29 @@ def main():
     # Step 4: Perform detailed analysis
     print("\n[Step 4] Performing detailed analysis...")
     try:
-        # Rating Analysis
-        print("\n  Rating Analysis:")
-        rating_stats = analysis.rating_analysis()
-        if rating_stats:
-            for metric, value in rating_stats.items():
-                print(f"    • {metric}: {value:.2f}")
-        
-        # Cuisine Analysis
-        print("\n  Cuisine Analysis:")
-        cuisine_data = analysis.cuisine_analysis()
-        if cuisine_data:
-            print(f"    • Total unique cuisines: {len(cuisine_data['cuisine_count'])}")
-            print(f"    • Top 5 cuisines:")
-            for cuisine, count in cuisine_data['cuisine_count'].head(5).items():
-                print(f"      - {cuisine}: {count} restaurants")
-        
-        # Price Analysis
-        print("\n  Price Analysis:")
-        price_data = analysis.price_analysis()
-        if price_data:
-            print(f"    • Mean Price Range: {price_data['Mean Price']:.2f}")
-            print(f"    • Median Price Range: {price_data['Median Price']:.2f}")
+        with hooks.stage('detailed_analysis'):
+            # Rating Analysis
+            print("\n  Rating Analysis:")
+            rating_stats = analysis.rating_analysis()
+            if rating_stats:
+                for metric, value in rating_stats.items():
+                    print(f"    • {metric}: {value:.2f}")
+            
+            # Cuisine Analysis
+            print("\n  Cuisine Analysis:")
+            cuisine_data = analysis.cuisine_analysis()
+            if cuisine_data:
+                print(f"    • Total unique cuisines: {len(cuisine_data['cuisine_count'])}")
+                print(f"    • Top 5 cuisines:")
+                for cuisine, count in cuisine_data['cuisine_count'].head(5).items():
+                    print(f"      - {cuisine}: {count} restaurants")
+            
+            # Price Analysis
+            print("\n  Price Analysis:")
+            price_data = analysis.price_analysis()
+            if price_data:
+                print(f"    • Mean Price Range: {price_data['Mean Price']:.2f}")
+                print(f"    • Median Price Range: {price_data['Median Price']:.2f}")
     
     except Exception as e:
         print(f"✗ Error in detailed analysis: {e}")
@@ -82,27 +119,31 @@ def main():
     # Step 5: Create visualizations
     print("\n[Step 5] Creating visualizations...")
     try:
-        viz = RestaurantVisualizations(df)
-        print("✓ Creating visualization charts...")
-        
-        # Create individual visualizations
-        fig1 = viz.plot_rating_distribution()
-        print("  • Rating distribution chart created")
-        
-        fig2 = viz.plot_cuisine_analysis()
-        print("  • Cuisine analysis chart created")
-        
-        fig3 = viz.plot_price_analysis()
-        print("  • Price analysis chart created")
-        
-        fig4 = viz.plot_city_analysis()
-        print("  • City analysis chart created")
-        
-        fig5 = viz.plot_correlation_heatmap()
-        print("  • Correlation heatmap created")
-        
-        print("\n✓ All visualizations created successfully")
-        print("  Note: To save visualizations, use viz.create_all_visualizations(save_path='./plots')")
+        with hooks.stage('visualize'):
+            from visualizations import RestaurantVisualizations
+            hooks.instrument(RestaurantVisualizations)
+            viz = RestaurantVisualizations(df, profile=analysis.profile(),
+                                           correlation=analysis.correlation_analysis())
+            print("✓ Creating visualization charts...")
+            
+            # Create individual visualizations
+            fig1 = viz.plot_rating_distribution()
+            print("  • Rating distribution chart created")
+            
+            fig2 = viz.plot_cuisine_analysis()
+            print("  • Cuisine analysis chart created")
+            
+            fig3 = viz.plot_price_analysis()
+            print("  • Price analysis chart created")
+            
+            fig4 = viz.plot_city_analysis()
+            print("  • City analysis chart created")
+            
+            fig5 = viz.plot_correlation_heatmap()
+            print("  • Correlation heatmap created")
+            
+            print("\n✓ All visualizations created successfully")
+            print("  Note: To save visualizations, use viz.create_all_visualizations(save_path='./plots')")
     
     except Exception as e:
         print(f"✗ Error creating visualizations: {e}")
@@ -0,0 +1,151 @@
+import os
+import pandas as pd
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from data_io import read_frame, partition_files
+
+
+def _partial_stats(codes, values, num_groups):
+    """Per-group count, sum, sum of squared deviations, min and max"""
+    valid = codes >= 0
+    codes = codes[valid]
+    values = values[valid]
+    count = np.bincount(codes, minlength=num_groups)
+    total = np.bincount(codes, weights=values, minlength=num_groups)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = np.where(count > 0, total / count, 0.0)
+    m2 = np.bincount(codes, weights=(values - mean[codes]) ** 2, minlength=num_groups)
+    minimum = np.full(num_groups, np.inf)
+    maximum = np.full(num_groups, -np.inf)
+    np.minimum.at(minimum, codes, values)
+    np.maximum.at(maximum, codes, values)
+    return pd.DataFrame({'count': count, 'sum': total, 'm2': m2,
+                         'min': minimum, 'max': maximum})
+
+
+def _merge(left, right):
+    """Chan-merge two partial tables indexed by group"""
+    left, right = left.align(right, fill_value=0)
+    count = left['count'] + right['count']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delta = (right['sum'] / right['count']) - (left['sum'] / left['count'])
+        correction = (delta ** 2 * left['count'] * right['count'] / count).fillna(0)
+    return pd.DataFrame({
+        'count': count,
+        'sum': left['sum'] + right['sum'],
+        'm2': left['m2'] + right['m2'] + correction,
+        'min': np.minimum(left['min'].where(left['count'] > 0, np.inf),
+                          right['min'].where(right['count'] > 0, np.inf)),
+        'max': np.maximum(left['max'].where(left['count'] > 0, -np.inf),
+                          right['max'].where(right['count'] > 0, -np.inf))
+    })
+
+
+def _shared_partial(task):
+    """Worker: aggregate one row range of arrays held in shared memory"""
+    codes_name, codes_dtype, values_name, length, start, end, num_groups = task
+    codes_shm = values_shm = None
+    codes = values = None
+    try:
+        codes_shm = shared_memory.SharedMemory(name=codes_name)
+        values_shm = shared_memory.SharedMemory(name=values_name)
+        codes = np.ndarray(length, dtype=codes_dtype, buffer=codes_shm.buf)
+        values = np.ndarray(length, dtype=np.float64, buffer=values_shm.buf)
+        return _partial_stats(codes[start:end].astype(np.intp), values[start:end], num_groups)
+    finally:
+        # Views must be dropped before the buffers can be closed
+        del codes, values
+        for shm in (codes_shm, values_shm):
+            if shm is not None:
+                shm.close()
+
+
+def _file_partial(task):
+    """Worker: read one partition file and aggregate it by group value"""
+    path, by, value = task
+    df = read_frame(path, columns=[by, value])
+    codes, uniques = pd.factorize(df[by])
+    partial = _partial_stats(codes, df[value].to_numpy(dtype=np.float64), len(uniques))
+    partial.index = pd.Index(np.asarray(uniques))
+    return partial
+
+
+def _run(worker, tasks, n_jobs):
+    if n_jobs == 1 or len(tasks) <= 1:
+        return [worker(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        return list(executor.map(worker, tasks))
+
+
+def _to_shared(array):
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+    return shm
+
+
+# Below this many rows a frame is aggregated in-process: the serial pass runs
+# at roughly 10-15 ns per row, less than the cost of starting a process pool
+PARALLEL_MIN_ROWS = 20_000_000
+
+
+def parallel_group_stats(source, by, value='rating', n_jobs=None, partition_rows=1_000_000):
+    """Per-group count/sum/mean/std/min/max of ``value`` using a process pool
+
+    ``source`` is a DataFrame or a partitioned dataset directory. Frames are
+    split into ``partition_rows`` row ranges whose group codes and values sit
+    in shared memory, so workers read them without pickling the frame; a
+    directory is processed one partition file per task. Partial results are
+    merged in partition order, so the output does not depend on ``n_jobs``
+    (``n_jobs=1`` runs the same partitions in this process).
+
+    ``n_jobs`` is capped at the CPU count, and frames smaller than
+    ``PARALLEL_MIN_ROWS`` always run serially, where a pool would only add
+    start-up and transfer overhead.
+    """
+    cpus = os.cpu_count() or 1
+    n_jobs = min(n_jobs or cpus, cpus)
+    if isinstance(source, pd.DataFrame) and len(source) < PARALLEL_MIN_ROWS:
+        n_jobs = 1
+
+    if not isinstance(source, pd.DataFrame):
+        tasks = [(path, by, value) for path in partition_files(source)]
+        partials = _run(_file_partial, tasks, n_jobs)
+    else:
+        keys = source[by]
+        if isinstance(keys.dtype, pd.CategoricalDtype):
+            codes, uniques = keys.cat.codes.to_numpy(), keys.cat.categories
+        else:
+            codes, uniques = pd.factorize(keys)
+        values = source[value].to_numpy(dtype=np.float64)
+        bounds = [(start, min(start + partition_rows, len(source)))
+                  for start in range(0, len(source), partition_rows)]
+
+        if n_jobs == 1 or len(bounds) <= 1:
+            partials = [_partial_stats(codes[start:end].astype(np.intp), values[start:end], len(uniques))
+                        for start, end in bounds]
+        else:
+            codes_shm = _to_shared(codes)
+            values_shm = _to_shared(values)
+            try:
+                tasks = [(codes_shm.name, codes.dtype, values_shm.name, len(source),
+                          start, end, len(uniques)) for start, end in bounds]
+                partials = _run(_shared_partial, tasks, n_jobs)
+            finally:
+                for shm in (codes_shm, values_shm):
+                    shm.close()
+                    shm.unlink()
+        for partial in partials:
+            partial.index = pd.Index(np.asarray(uniques))
+
+    if not partials:
+        return pd.DataFrame(columns=['count', 'sum', 'mean', 'std', 'min', 'max'])
+    result = partials[0]
+    for partial in partials[1:]:
+        result = _merge(result, partial)
+    result = result[result['count'] > 0].copy()
+    result['count'] = result['count'].astype(np.int64)
+    result['mean'] = result['sum'] / result['count']
+    result['std'] = np.sqrt(result['m2'] / (result['count'] - 1))
+    result.index.name = by
+    return result[['count', 'sum', 'mean', 'std', 'min', 'max']]
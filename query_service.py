@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Restaurant query service
+
+Loads a dataset once and answers JSON queries over HTTP from the in-memory
+aggregates of a RestaurantAnalysis:
+
+    GET /health
+    GET /rating
+    GET /cuisines?top=10
+    GET /cities
+    GET /price
+    GET /correlation?method=spearman
+    GET /query?city=Pune&price_range=1,2
+    GET /query?rating=4.2:&cost_for_two=500:900&delivery_time=:30&price_range=2
+    GET /group?by=city&value=cost_for_two
+    GET /top?by=city&k=5
+
+Usage:
+    python query_service.py --data restaurant_data.csv --port 8765
+"""
+
+import json
+import asyncio
+import argparse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+import numpy as np
+import pandas as pd
+from restaurant_analysis import RestaurantAnalysis
+from data_io import apply_dtypes
+from range_index import RANGE_COLUMNS
+
+# Largest k served by /top; each distinct (k, by) keeps a leaderboard in memory
+MAX_TOP_K = 100
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           500: 'Internal Server Error'}
+
+
+def _to_json(value):
+    """json.dumps ``default`` hook for pandas and numpy results
+
+    float32 values are written in their shortest decimal form, so a 3.8
+    stays 3.8 rather than 3.799999952316284.
+    """
+    if isinstance(value, pd.DataFrame):
+        value = _float64(value)
+        return {str(key): row for key, row in value.to_dict(orient='index').items()}
+    if isinstance(value, pd.Series):
+        return {str(key): item for key, item in value.items()}
+    if isinstance(value, np.float32):
+        return float(str(value))
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _float64(df):
+    """``df`` with float32 columns widened to float64 through their decimal form"""
+    return apply_dtypes(df.copy(), {col: 'float64' for col, dtype in df.dtypes.items()
+                                    if dtype == 'float32'})
+
+
+def _k(params, name, default):
+    """Positive integer parameter ``name``, at most ``MAX_TOP_K``"""
+    k = int(params.get(name, [str(default)])[0])
+    if not 1 <= k <= MAX_TOP_K:
+        raise ValueError(f"'{name}' must be between 1 and {MAX_TOP_K}")
+    return k
+
+
+def _range(col, value):
+    """``low:high`` (either side may be empty) or a bare value matching it exactly"""
+    if not value:
+        raise ValueError(f"Empty value in filter '{col}'")
+    if ':' not in value:
+        return (float(value), float(value))
+    low, _, high = value.partition(':')
+    if not low and not high:
+        raise ValueError(f"Range for '{col}' needs a low or high bound")
+    return (float(low) if low else None, float(high) if high else None)
+
+
+class LRUCache:
+    """Bounded mapping that drops the least recently used entry when full"""
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+
+class QueryService:
+    """Answer analysis queries from one loaded RestaurantAnalysis
+
+    Aggregates (profile, correlation, bitmap indexes) are computed once at
+    start-up. Each query runs in a thread pool so pandas work never blocks
+    the event loop, and encoded responses are kept in an LRU cache keyed by
+    path and query string.
+    """
+
+    def __init__(self, analysis, cache_size=1024, workers=4):
+        self.analysis = analysis
+        self.cache = LRUCache(cache_size)
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.routes = {
+            '/health': self.health,
+            '/rating': self.rating,
+            '/cuisines': self.cuisines,
+            '/cities': self.cities,
+            '/price': self.price,
+            '/correlation': self.correlation,
+            '/query': self.query,
+            '/group': self.group,
+            '/top': self.top
+        }
+
+    def warm_up(self):
+        """Compute the shared aggregates and indexes before serving"""
+        self.analysis.profile()
+        self.analysis.correlation_analysis()
+        self.analysis.correlation_analysis('spearman')
+        self.analysis.build_indexes()
+        self.analysis.build_range_index()
+
+    # Handlers take the parsed query string and return a JSON-serializable value
+
+    def health(self, params):
+        return {'status': 'ok', 'rows': self.analysis.profile()['rows'],
+                'cache_entries': len(self.cache.entries),
+                'cache_hits': self.cache.hits, 'cache_misses': self.cache.misses}
+
+    def rating(self, params):
+        return self.analysis.rating_analysis()
+
+    def cuisines(self, params):
+        top = _k(params, 'top', 10)
+        data = self.analysis.cuisine_analysis()
+        return {'count': data['cuisine_count'].head(top),
+                'rating': data['cuisine_ratings'].head(top)}
+
+    def cities(self, params):
+        profile = self.analysis.profile()
+        return {'count': profile['city_count'], 'rating': profile['city_ratings']}
+
+    def price(self, params):
+        stats = self.analysis.price_analysis()
+        return {'mean': stats['Mean Price'], 'median': stats['Median Price'],
+                'count': stats['Price Distribution'],
+                'rating': self.analysis.profile()['price_ratings']}
+
+    def correlation(self, params):
+        method = params.get('method', ['pearson'])[0]
+        if method not in ('pearson', 'spearman'):
+            raise ValueError(f"Unknown correlation method '{method}'")
+        return self.analysis.correlation_analysis(method)
+
+    def query(self, params):
+        df = self.analysis.df
+        filters = {}
+        for col, values in params.items():
+            if col not in df.columns:
+                raise ValueError(f"Unknown column '{col}'")
+            if col in RANGE_COLUMNS:
+                filters[col] = _range(col, values[0])
+                continue
+            values = [value for item in values for value in item.split(',')]
+            if not all(values):
+                raise ValueError(f"Empty value in filter '{col}'")
+            if pd.api.types.is_bool_dtype(df[col].dtype):
+                values = [value.lower() in ('1', 'true', 'yes') for value in values]
+            elif pd.api.types.is_integer_dtype(df[col].dtype):
+                values = [int(value) for value in values]
+            filters[col] = values
+        return self.analysis.query_summary(**filters)
+
+    def group(self, params):
+        by = params.get('by', ['city'])[0]
+        value = params.get('value', ['rating'])[0]
+        for col in (by, value):
+            if col not in self.analysis.df.columns:
+                raise ValueError(f"Unknown column '{col}'")
+        return self.analysis.group_stats(by, value, n_jobs=1)
+
+    def top(self, params):
+        k = _k(params, 'k', 10)
+        by = params.get('by', [None])[0]
+        if by is not None and by not in self.analysis.df.columns:
+            raise ValueError(f"Unknown column '{by}'")
+        return _float64(self.analysis.top_restaurants(k, by)).to_dict(orient='records')
+
+    async def respond(self, target):
+        """Status and encoded body for a request target such as ``/query?city=Pune``"""
+        url = urlsplit(target)
+        handler = self.routes.get(url.path)
+        if handler is None:
+            return 404, json.dumps({'error': f"Unknown path '{url.path}'"}).encode()
+        if url.path == '/health':
+            return 200, json.dumps(handler({}), default=_to_json).encode()
+
+        key = (url.path, url.query)
+        body = self.cache.get(key)
+        if body is not None:
+            return 200, body
+
+        def run():
+            result = handler(parse_qs(url.query, keep_blank_values=True))
+            return json.dumps(result, default=_to_json).encode()
+
+        loop = asyncio.get_running_loop()
+        try:
+            body = await loop.run_in_executor(self.executor, run)
+        except (ValueError, KeyError, TypeError) as e:
+            return 400, json.dumps({'error': str(e)}).encode()
+        except Exception as e:
+            return 500, json.dumps({'error': str(e)}).encode()
+        self.cache.put(key, body)
+        return 200, body
+
+    async def handle(self, reader, writer):
+        """Serve HTTP/1.1 requests on one connection, keeping it alive"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode('latin-1').split(' ', 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                if method != 'GET':
+                    status, body = 405, json.dumps({'error': 'Only GET is supported'}).encode()
+                else:
+                    status, body = await self.respond(target)
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8765):
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"Serving restaurant queries on http://{host}:{port}", flush=True)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Restaurant analysis query service")
+    parser.add_argument('--data', help="data file or partition directory (default: 1000 sample rows)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=4, help="threads running queries")
+    parser.add_argument('--cache-size', type=int, default=1024, help="responses kept in the LRU cache")
+    args = parser.parse_args(argv)
+
+    analysis = RestaurantAnalysis()
+    if args.data:
+        analysis.load_data(args.data)
+    else:
+        from generate_sample_data import RestaurantDataGenerator
+        analysis.df = RestaurantDataGenerator().generate_sample_data(num_records=1000)
+    if analysis.df is None:
+        return 1
+
+    service = QueryService(analysis, cache_size=args.cache_size, workers=args.workers)
+    service.warm_up()
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nService stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,145 @@
+import os
+import math
+import numpy as np
+from data_io import partition_files
+
+# Numeric columns that get a sorted permutation for range predicates
+RANGE_COLUMNS = ['rating', 'cost_for_two', 'delivery_time', 'num_reviews']
+
+
+def index_path(data_path):
+    """Where the range index of a data file or partition directory is stored"""
+    return os.path.normpath(data_path) + '.range.npz'
+
+
+def _source_stamp(data_path):
+    """Sizes and modification times of the files behind ``data_path``"""
+    paths = partition_files(data_path) if os.path.isdir(data_path) else [data_path]
+    return np.array([(os.stat(p).st_size, os.stat(p).st_mtime_ns) for p in paths], dtype=np.int64)
+
+
+def _key(dtype, value, rounding):
+    """``value`` as a scalar of ``dtype``, or None when an integer dtype cannot hold it
+
+    Searching with a scalar of the column's own dtype keeps ``searchsorted``
+    from casting the whole column, and compares floats in the column's
+    precision, so a float32 column still matches its stored 4.2 for
+    ``>= 4.2``. Infinite bounds on integer columns give None like any other
+    value out of range; NaN raises ValueError since it bounds nothing.
+    """
+    if math.isnan(value):
+        raise ValueError("Range bounds cannot be NaN")
+    if np.issubdtype(dtype, np.floating):
+        return dtype.type(value)
+    if math.isinf(value):
+        return None
+    value = rounding(value)
+    info = np.iinfo(dtype)
+    return dtype.type(value) if info.min <= value <= info.max else None
+
+
+class RangeIndex:
+    """Sorted row permutation per numeric column
+
+    A range predicate such as "cost for two between 500 and 900" becomes two
+    binary searches over the column's sorted values, and the matching rows
+    are a contiguous slice of the permutation. Several predicates start from
+    the most selective slice and check the other columns on those rows only,
+    so a selective query costs O(log n + matches) instead of a scan. NaN
+    values sort last and never match a predicate on their column.
+    """
+
+    def __init__(self, df, columns=None, orders=None):
+        self.num_rows = len(df)
+        self.values = {}
+        self.order = {}
+        self.sorted = {}
+        self.valid = {}
+        for col in columns or [c for c in RANGE_COLUMNS if c in df.columns]:
+            values = df[col].to_numpy()
+            if values.dtype == object:
+                # Nullable integer columns with missing values, e.g. Int16
+                values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            order = orders[col] if orders else np.argsort(values, kind='stable').astype(np.int32)
+            self.values[col] = values
+            self.order[col] = order
+            self.sorted[col] = values[order]
+            # Sorted position of the first NaN, which ends every slice
+            self.valid[col] = len(values) - int(np.isnan(self.sorted[col]).sum()) \
+                if np.issubdtype(values.dtype, np.floating) else len(values)
+
+    @classmethod
+    def open(cls, df, data_path, columns=None):
+        """Load the index stored next to ``data_path``, or build and store it
+
+        A stored index is reused only while the data files keep their size
+        and modification time and it covers the same rows and columns.
+        """
+        path = index_path(data_path)
+        stamp = _source_stamp(data_path)
+        columns = columns or [c for c in RANGE_COLUMNS if c in df.columns]
+        try:
+            with np.load(path) as stored:
+                if (np.array_equal(stored['stamp'], stamp)
+                        and int(stored['num_rows']) == len(df)
+                        and set(columns) <= set(stored.files)):
+                    return cls(df, columns, {col: stored[col] for col in columns})
+        except (OSError, KeyError, ValueError):
+            pass
+
+        index = cls(df, columns)
+        try:
+            np.savez(path, stamp=stamp, num_rows=len(df), **index.order)
+        except OSError as e:
+            print(f"Could not store range index: {e}")
+        return index
+
+    def range(self, col, low=None, high=None):
+        """Row positions with ``low <= value <= high`` (either bound may be None)"""
+        if col not in self.order:
+            raise KeyError(f"No range index for column '{col}'")
+        start, end = self._bounds(col, low, high)
+        return self.order[col][start:end]
+
+    def _bounds(self, col, low, high):
+        """Slice of the sorted values within ``[low, high]``"""
+        keys = self.sorted[col][:self.valid[col]]
+        start, end = 0, len(keys)
+        if low is not None:
+            key = _key(keys.dtype, low, math.ceil)
+            start = np.searchsorted(keys, key, side='left') if key is not None else \
+                (0 if low < 0 else len(keys))
+        if high is not None:
+            key = _key(keys.dtype, high, math.floor)
+            end = np.searchsorted(keys, key, side='right') if key is not None else \
+                (len(keys) if high > 0 else 0)
+        return start, max(start, end)
+
+    def query(self, **ranges):
+        """Sorted row positions matching every ``col=(low, high)`` predicate"""
+        if not ranges:
+            return np.arange(self.num_rows)
+        for col in ranges:
+            if col not in self.order:
+                raise KeyError(f"No range index for column '{col}'")
+
+        bounds = {col: self._bounds(col, *ranges[col]) for col in ranges}
+        first = min(bounds, key=lambda col: bounds[col][1] - bounds[col][0])
+        start, end = bounds[first]
+        rows = self.order[first][start:end]
+        for col, (start, end) in bounds.items():
+            if col == first or len(rows) == 0:
+                continue
+            if start == end:
+                rows = rows[:0]
+                continue
+            # The slice's end values bound it exactly, with no NaN inside
+            keys = self.sorted[col]
+            values = self.values[col][rows]
+            rows = rows[(values >= keys[start]) & (values <= keys[end - 1])]
+        if len(rows) > self.num_rows // 8:
+            # Marking a mask is cheaper than sorting once matches are dense
+            mask = np.zeros(self.num_rows, dtype=bool)
+            mask[rows] = True
+            return np.flatnonzero(mask)
+        return np.sort(rows)
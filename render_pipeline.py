@@ -0,0 +1,197 @@
+import os
+import sys
+import time
+import shutil
+import hashlib
+import pandas as pd
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+def render_chart(job):
+    """Draw one chart, save it and close it
+
+    ``job`` is ``(filename, plot, args, save_path, dpi, rc)`` where
+    ``plot(*args)`` returns a matplotlib figure. Returns the filename and
+    the render time in seconds.
+    """
+    filename, plot, args, save_path, dpi, rc = job
+    import matplotlib.pyplot as plt
+
+    start = time.perf_counter()
+    with plt.rc_context(rc):
+        fig = plot(*args)
+        try:
+            fig.savefig(os.path.join(save_path, filename), dpi=dpi, bbox_inches='tight')
+        finally:
+            plt.close(fig)
+    return filename, time.perf_counter() - start
+
+
+def _render_in_worker(job):
+    """Worker entry point: render on the non-interactive Agg backend"""
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+    return render_chart(job)
+
+
+def _module_source(obj):
+    """Source bytes of the module defining ``obj`` (empty if unavailable)"""
+    module = sys.modules.get(getattr(obj, '__module__', None))
+    path = getattr(module, '__file__', None)
+    if not path or not os.path.exists(path):
+        return b''
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _feed(digest, value):
+    """Add a chart input to ``digest`` by content rather than identity"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        dtypes = value.dtypes if isinstance(value, pd.DataFrame) else {value.name: value.dtype}
+        digest.update(repr((type(value).__name__, list(dict(dtypes).items()),
+                            list(value.index.names), len(value))).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(repr((value.dtype.str, value.shape)).encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        digest.update(b'dict')
+        for key in sorted(value, key=repr):
+            digest.update(repr(key).encode())
+            _feed(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(f'{type(value).__name__}{len(value)}'.encode())
+        for item in value:
+            _feed(digest, item)
+    elif hasattr(value, '__self__') and hasattr(value, '__func__'):
+        _feed(digest, value.__self__)
+        _feed(digest, value.__func__)
+    elif callable(value) and hasattr(value, '__qualname__'):
+        digest.update(f'{value.__module__}.{value.__qualname__}'.encode())
+        digest.update(_module_source(value))
+    elif hasattr(value, '__dict__'):
+        _feed(digest, type(value))
+        _feed(digest, vars(value))
+    else:
+        digest.update(repr(value).encode())
+
+
+def chart_key(plot, args, dpi, rc):
+    """Content hash identifying the PNG that ``plot(*args)`` would produce
+
+    Covers the chart inputs by value, the source of the modules defining the
+    chart function (and any objects passed to it), the DPI, the rcParams the
+    chart is drawn under, this pipeline's save settings and the matplotlib
+    version. Hashing large frames is still far cheaper than drawing them.
+    """
+    import matplotlib
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(matplotlib.__version__.encode())
+    digest.update(_module_source(render_chart))
+    _feed(digest, plot)
+    _feed(digest, args)
+    _feed(digest, dpi)
+    _feed(digest, dict(rc))
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Rendered PNGs on disk, keyed by ``chart_key``
+
+    A hit copies the stored PNG to the output path instead of drawing the
+    chart again. Entries are evicted least-recently-used first once the
+    directory grows beyond ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir='.restaurant_cache/charts', max_bytes=512 * 1024 ** 2):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.png')
+
+    def get(self, key, destination):
+        """Copy the cached PNG to ``destination``; False on a miss"""
+        path = self._path(key)
+        try:
+            shutil.copyfile(path, destination)
+        except OSError:
+            return False
+        os.utime(path)
+        return True
+
+    def put(self, key, source):
+        """Store a rendered PNG and evict old entries if over the size limit"""
+        path = self._path(key)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until under ``max_bytes``"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.png'):
+                stat = os.stat(os.path.join(self.cache_dir, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(os.path.join(self.cache_dir, name))
+            total -= size
+
+    def clear(self):
+        """Delete every cached PNG"""
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.png'):
+                os.remove(os.path.join(self.cache_dir, name))
+
+
+def render_charts(charts, save_path, n_jobs=None, dpi=300, rc=None, cache_dir=None):
+    """Render charts to PNG files in worker processes
+
+    ``charts`` is a list of ``(filename, plot, args)``; ``plot`` and
+    ``args`` must be picklable, so pass aggregates rather than large frames.
+    Each worker renders one chart at a time and closes its figure as soon as
+    the PNG is written, so at most ``n_jobs`` figures exist at once.
+    With ``cache_dir`` set, charts whose ``chart_key`` was rendered before
+    are copied from the render cache and only the rest are drawn.
+    Returns ``(filename, seconds)`` pairs in completion order.
+    """
+    os.makedirs(save_path, exist_ok=True)
+    rc = rc or {}
+    jobs = [(filename, plot, args, save_path, dpi, rc)
+            for filename, plot, args in charts]
+
+    timings = []
+    keys = {}
+    if cache_dir:
+        cache = RenderCache(cache_dir)
+        pending = []
+        for job in jobs:
+            start = time.perf_counter()
+            filename, plot, args = job[:3]
+            keys[filename] = chart_key(plot, args, dpi, rc)
+            if cache.get(keys[filename], os.path.join(save_path, filename)):
+                timings.append((filename, time.perf_counter() - start))
+            else:
+                pending.append(job)
+        jobs = pending
+
+    if n_jobs == 1 or not jobs:
+        rendered = [render_chart(job) for job in jobs]
+    else:
+        rendered = []
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [executor.submit(_render_in_worker, job) for job in jobs]
+            for future in as_completed(futures):
+                rendered.append(future.result())
+
+    for filename, _ in rendered:
+        if filename in keys:
+            cache.put(keys[filename], os.path.join(save_path, filename))
+    return timings + rendered
@@ -0,0 +1,106 @@
+import os
+import hashlib
+import pickle
+import pandas as pd
+from data_io import partition_files
+
+# Bump when cached result structures change so old entries are ignored
+CACHE_VERSION = 6
+
+
+def file_fingerprint(path):
+    """Content hash of a data file or partitioned directory"""
+    digest = hashlib.blake2b(digest_size=16)
+    paths = partition_files(path) if os.path.isdir(path) else [path]
+    for part in paths:
+        digest.update(os.path.basename(part).encode())
+        with open(part, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def frame_fingerprint(df):
+    """Hash of a DataFrame's column names, dtypes and values"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(list(df.dtypes.astype(str).items())).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Pickled analysis results on disk, keyed by dataset fingerprint
+
+    Entries are evicted least-recently-used first once the directory grows
+    beyond ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir='.restaurant_cache', max_bytes=256 * 1024 ** 2):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, fingerprint, key):
+        return os.path.join(self.cache_dir, f'v{CACHE_VERSION}-{fingerprint}-{key}.pkl')
+
+    def fingerprint(self, path, *options):
+        """Content fingerprint of ``path`` combined with load ``options``
+
+        The content hash is remembered per (path, size, mtime) so unchanged
+        files are not read again.
+        """
+        stat = os.stat(path)
+        if os.path.isdir(path):
+            stats = [os.stat(part) for part in partition_files(path)]
+            stat_key = [(s.st_size, s.st_mtime_ns) for s in stats]
+        else:
+            stat_key = (stat.st_size, stat.st_mtime_ns)
+        stat_id = hashlib.blake2b(repr((os.path.abspath(path), stat_key)).encode(),
+                                  digest_size=16).hexdigest()
+
+        content = self.get(stat_id, 'content')
+        if content is None:
+            content = file_fingerprint(path)
+            self.put(stat_id, 'content', content)
+        return hashlib.blake2b(repr((content, options)).encode(),
+                               digest_size=16).hexdigest()
+
+    def get(self, fingerprint, key):
+        """Return the cached value, or None on a miss"""
+        path = self._path(fingerprint, key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        os.utime(path)
+        return value
+
+    def put(self, fingerprint, key, value):
+        """Store a value and evict old entries if over the size limit"""
+        path = self._path(fingerprint, key)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until under ``max_bytes``"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.pkl'):
+                stat = os.stat(os.path.join(self.cache_dir, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(os.path.join(self.cache_dir, name))
+            total -= size
+
+    def clear(self):
+        """Delete every cached entry"""
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.pkl'):
+                os.remove(os.path.join(self.cache_dir, name))
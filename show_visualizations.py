@@ -5,77 +5,59 @@ Generates and displays all charts from the Restaurant Analysis Project
 """
 
 import matplotlib.pyplot as plt
-import seaborn as sns
 import pandas as pd
 import numpy as np
 from generate_sample_data import RestaurantDataGenerator
-from visualizations import RestaurantVisualizations
+from restaurant_analysis import RestaurantAnalysis, top_k
+from visualizations import RestaurantVisualizations, chart_style, styled
+from render_pipeline import render_charts
+from accumulators import DensityGrid
 
+# Above this many rows the rating-vs-reviews scatter is drawn as a density image
+DENSITY_THRESHOLD = 100_000
 
-def create_all_visualizations():
-    """
-    Generate sample data and create all visualization charts
-    """
-    
-    print("\n" + "="*70)
-    print("RESTAURANT ANALYSIS - COMPREHENSIVE VISUALIZATIONS")
-    print("="*70)
-    
-    # Step 1: Generate sample data
-    print("\n[1] Generating Sample Restaurant Data...")
-    generator = RestaurantDataGenerator()
-    df = generator.generate_sample_data(num_records=1000)
-    print(f"    ✓ Generated {len(df)} restaurant records")
-    print(f"    ✓ Cuisines: {df['cuisine'].nunique()}")
-    print(f"    ✓ Cities: {df['city'].nunique()}")
-    
-    # Step 2: Initialize visualization class
-    print("\n[2] Initializing Visualization Module...")
-    viz = RestaurantVisualizations(df)
-    print("    ✓ Visualization module ready")
-    
-    # Step 3: Create Rating Distribution Chart
-    print("\n[3] Creating Rating Distribution Charts...")
-    fig1 = viz.plot_rating_distribution()
-    fig1.suptitle('CHART 1: Rating Distribution Analysis', 
-                  fontsize=16, fontweight='bold', y=1.00)
-    print("    ✓ Rating histogram and box plot created")
-    plt.tight_layout()
-    
-    # Step 4: Create Cuisine Analysis Chart
-    print("\n[4] Creating Cuisine Popularity Charts...")
-    fig2 = viz.plot_cuisine_analysis()
-    fig2.suptitle('CHART 2: Cuisine Analysis - Popularity & Ratings', 
-                  fontsize=16, fontweight='bold', y=1.00)
-    print("    ✓ Top cuisines by count and rating created")
-    plt.tight_layout()
-    
-    # Step 5: Create Price Analysis Chart
-    print("\n[5] Creating Price Range Analysis Charts...")
-    fig3 = viz.plot_price_analysis()
-    fig3.suptitle('CHART 3: Price Range Distribution & Quality', 
-                  fontsize=16, fontweight='bold', y=1.00)
-    print("    ✓ Price distribution and rating correlation created")
-    plt.tight_layout()
+
+def plot_rating_vs_reviews(ax, df, density_threshold=DENSITY_THRESHOLD, bins=100, rating_step=0.1):
+    """Rating vs review count: a scatter, or a binned density image for large data
     
-    # Step 6: Create City Analysis Chart
-    print("\n[6] Creating City-wise Analysis Charts...")
-    fig4 = viz.plot_city_analysis()
-    fig4.suptitle('CHART 4: Geographic Distribution & Ratings', 
-                  fontsize=16, fontweight='bold', y=1.00)
-    print("    ✓ City distribution and average ratings created")
-    plt.tight_layout()
+    Above ``density_threshold`` rows the points are counted into a
+    ``DensityGrid`` (which can also be accumulated chunk by chunk) and drawn
+    as one raster image, so cost and output size no longer grow per row.
+    Review counts use ``bins`` bins; ratings get one bin per ``rating_step``
+    so each one-decimal rating has its own row.
+    """
+    if len(df) <= density_threshold:
+        scatter = ax.scatter(df['num_reviews'], df['rating'], 
+                             alpha=0.5, c=df['rating'], cmap='viridis', s=50)
+        plt.colorbar(scatter, ax=ax)
+        return
     
-    # Step 7: Create Correlation Heatmap
-    print("\n[7] Creating Correlation Heatmap...")
-    fig5 = viz.plot_correlation_heatmap()
-    print("    ✓ Correlation analysis heatmap created")
+    x_edges = np.linspace(df['num_reviews'].min(), df['num_reviews'].max(), bins + 1)
+    y_min, y_max = float(df['rating'].min()), float(df['rating'].max())
+    num_steps = int(round((y_max - y_min) / rating_step)) + 1
+    y_edges = y_min - rating_step / 2 + rating_step * np.arange(num_steps + 1)
+    grid = DensityGrid(x_edges, y_edges)
+    grid.update(df['num_reviews'], df['rating'])
+    image = ax.imshow(grid.counts.T, origin='lower', aspect='auto', cmap='viridis',
+                      extent=(x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]),
+                      interpolation='nearest')
+    plt.colorbar(image, ax=ax, label='Restaurants')
+
+
+@styled
+def titled_chart(viz, method, title):
+    """Draw a RestaurantVisualizations chart and give it a chart title"""
+    fig = getattr(viz, method)()
+    fig.suptitle(title, fontsize=16, fontweight='bold', y=1.00)
     plt.tight_layout()
-    
-    # Step 8: Create Additional Statistics Visualizations
-    print("\n[8] Creating Additional Statistical Visualizations...")
-    fig6, axes = plt.subplots(2, 2, figsize=(14, 10))
-    fig6.suptitle('CHART 5: Additional Restaurant Statistics', 
+    return fig
+
+
+@styled
+def plot_additional_statistics(df):
+    """CHART 5: delivery time, cost, vegetarian and online delivery (2x2 grid)"""
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig.suptitle('CHART 5: Additional Restaurant Statistics', 
                   fontsize=16, fontweight='bold')
     
     # 8.1: Delivery Time Distribution
@@ -107,22 +89,22 @@ def create_all_visualizations():
     axes[1, 1].set_title('Online Delivery Availability', fontsize=12, fontweight='bold')
     
     plt.tight_layout()
-    print("    ✓ Delivery time, cost, vegetarian, and delivery status charts created")
-    
-    # Step 9: Create Advanced Analysis Visualizations
-    print("\n[9] Creating Advanced Analysis Visualizations...")
-    fig7, axes = plt.subplots(2, 2, figsize=(14, 10))
-    fig7.suptitle('CHART 6: Advanced Restaurant Metrics', 
+    return fig
+
+
+@styled
+def plot_advanced_metrics(df, density_threshold=DENSITY_THRESHOLD):
+    """CHART 6: ratings vs reviews, delivery impact, top restaurants, price vs rating"""
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig.suptitle('CHART 6: Advanced Restaurant Metrics', 
                   fontsize=16, fontweight='bold')
     
     # 9.1: Rating vs Review Count Scatter
-    scatter = axes[0, 0].scatter(df['num_reviews'], df['rating'], 
-                                alpha=0.5, c=df['rating'], cmap='viridis', s=50)
+    plot_rating_vs_reviews(axes[0, 0], df, density_threshold)
     axes[0, 0].set_title('Rating vs Review Count', fontsize=12, fontweight='bold')
     axes[0, 0].set_xlabel('Number of Reviews')
     axes[0, 0].set_ylabel('Rating')
     axes[0, 0].grid(alpha=0.3)
-    plt.colorbar(scatter, ax=axes[0, 0])
     
     # 9.2: Average Rating by Delivery Time
     delivery_bins = pd.cut(df['delivery_time'], bins=5)
@@ -138,7 +120,7 @@ def create_all_visualizations():
                               rotation=45)
     
     # 9.3: Top Restaurants by Rating
-    top_restaurants = df.nlargest(10, 'rating')[['restaurant_name', 'rating']].reset_index(drop=True)
+    top_restaurants = top_k(df, 10).result()
     axes[1, 0].barh(range(len(top_restaurants)), top_restaurants['rating'].values, color='gold')
     axes[1, 0].set_yticks(range(len(top_restaurants)))
     axes[1, 0].set_yticklabels(top_restaurants['restaurant_name'].values)
@@ -160,6 +142,114 @@ def create_all_visualizations():
     axes[1, 1].set_xticks([1, 2, 3, 4])
     
     plt.tight_layout()
+    return fig
+
+
+# Columns each raw-data grid needs, so workers receive only those
+ADDITIONAL_COLUMNS = ['delivery_time', 'cost_for_two', 'vegetarian', 'has_online_delivery']
+ADVANCED_COLUMNS = ['num_reviews', 'rating', 'delivery_time', 'restaurant_id', 'restaurant_name',
+                    'price_range']
+
+
+def save_all_visualizations(df, save_path, n_jobs=None, dpi=300, cache_dir=None):
+    """Render all seven charts to PNG files through the parallel pipeline
+    
+    With ``cache_dir`` set, unchanged charts are copied from the render
+    cache instead of being drawn again. Returns ``(filename, seconds)``
+    pairs in completion order.
+    """
+    analysis = RestaurantAnalysis()
+    analysis.df = df
+    viz = RestaurantVisualizations(profile=analysis.profile(),
+                                   correlation=analysis.correlation_analysis())
+    charts = [
+        ('chart1_rating_distribution.png', titled_chart,
+         (viz, 'plot_rating_distribution', 'CHART 1: Rating Distribution Analysis')),
+        ('chart2_cuisine_analysis.png', titled_chart,
+         (viz, 'plot_cuisine_analysis', 'CHART 2: Cuisine Analysis - Popularity & Ratings')),
+        ('chart3_price_analysis.png', titled_chart,
+         (viz, 'plot_price_analysis', 'CHART 3: Price Range Distribution & Quality')),
+        ('chart4_city_analysis.png', titled_chart,
+         (viz, 'plot_city_analysis', 'CHART 4: Geographic Distribution & Ratings')),
+        ('chart5_correlation_heatmap.png', viz.plot_correlation_heatmap, ()),
+        ('chart6_additional_statistics.png', plot_additional_statistics,
+         (df[ADDITIONAL_COLUMNS],)),
+        ('chart7_advanced_metrics.png', plot_advanced_metrics,
+         (df[ADVANCED_COLUMNS],))
+    ]
+    return render_charts(charts, save_path, n_jobs=n_jobs, dpi=dpi, rc=chart_style(),
+                         cache_dir=cache_dir)
+
+
+@styled
+def create_all_visualizations():
+    """
+    Generate sample data and create all visualization charts
+    """
+    
+    print("\n" + "="*70)
+    print("RESTAURANT ANALYSIS - COMPREHENSIVE VISUALIZATIONS")
+    print("="*70)
+    
+    # Step 1: Generate sample data
+    print("\n[1] Generating Sample Restaurant Data...")
+    generator = RestaurantDataGenerator()
+    df = generator.generate_sample_data(num_records=1000)
+    print(f"    ✓ Generated {len(df)} restaurant records")
+    print(f"    ✓ Cuisines: {df['cuisine'].nunique()}")
+    print(f"    ✓ Cities: {df['city'].nunique()}")
+    
+    # Step 2: Initialize visualization class
+    print("\n[2] Initializing Visualization Module...")
+    viz = RestaurantVisualizations(df)
+    print("    ✓ Visualization module ready")
+    
+    # Step 3: Create Rating Distribution Chart
+    print("\n[3] Creating Rating Distribution Charts...")
+    fig1 = viz.plot_rating_distribution()
+    fig1.suptitle('CHART 1: Rating Distribution Analysis', 
+                  fontsize=16, fontweight='bold', y=1.00)
+    print("    ✓ Rating histogram and box plot created")
+    plt.tight_layout()
+    
+    # Step 4: Create Cuisine Analysis Chart
+    print("\n[4] Creating Cuisine Popularity Charts...")
+    fig2 = viz.plot_cuisine_analysis()
+    fig2.suptitle('CHART 2: Cuisine Analysis - Popularity & Ratings', 
+                  fontsize=16, fontweight='bold', y=1.00)
+    print("    ✓ Top cuisines by count and rating created")
+    plt.tight_layout()
+    
+    # Step 5: Create Price Analysis Chart
+    print("\n[5] Creating Price Range Analysis Charts...")
+    fig3 = viz.plot_price_analysis()
+    fig3.suptitle('CHART 3: Price Range Distribution & Quality', 
+                  fontsize=16, fontweight='bold', y=1.00)
+    print("    ✓ Price distribution and rating correlation created")
+    plt.tight_layout()
+    
+    # Step 6: Create City Analysis Chart
+    print("\n[6] Creating City-wise Analysis Charts...")
+    fig4 = viz.plot_city_analysis()
+    fig4.suptitle('CHART 4: Geographic Distribution & Ratings', 
+                  fontsize=16, fontweight='bold', y=1.00)
+    print("    ✓ City distribution and average ratings created")
+    plt.tight_layout()
+    
+    # Step 7: Create Correlation Heatmap
+    print("\n[7] Creating Correlation Heatmap...")
+    fig5 = viz.plot_correlation_heatmap()
+    print("    ✓ Correlation analysis heatmap created")
+    plt.tight_layout()
+    
+    # Step 8: Create Additional Statistics Visualizations
+    print("\n[8] Creating Additional Statistical Visualizations...")
+    fig6 = plot_additional_statistics(df)
+    print("    ✓ Delivery time, cost, vegetarian, and delivery status charts created")
+    
+    # Step 9: Create Advanced Analysis Visualizations
+    print("\n[9] Creating Advanced Analysis Visualizations...")
+    fig7 = plot_advanced_metrics(df)
     print("    ✓ Rating vs reviews, delivery time, top restaurants, and price vs rating created")
     
     # Step 10: Summary Statistics
@@ -214,8 +304,24 @@ def create_all_visualizations():
 
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Restaurant analysis charts")
+    parser.add_argument('--save-path', help="render PNGs here instead of displaying them")
+    parser.add_argument('--jobs', type=int, default=None, help="worker processes for rendering")
+    parser.add_argument('--cache-dir', default='.restaurant_cache/charts',
+                        help="directory for cached chart renders")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="redraw every chart, ignoring cached renders")
+    args = parser.parse_args()
     try:
-        create_all_visualizations()
+        if args.save_path:
+            df = RestaurantDataGenerator().generate_sample_data(num_records=1000)
+            for filename, seconds in save_all_visualizations(
+                    df, args.save_path, n_jobs=args.jobs,
+                    cache_dir=None if args.no_cache else args.cache_dir):
+                print(f"  • {filename}: {seconds:.2f}s")
+        else:
+            create_all_visualizations()
     except Exception as e:
         print(f"\nError: {e}")
         import traceback
@@ -0,0 +1,220 @@
+"""
+Approximate sketches for high-cardinality columns
+
+Fixed-size, mergeable summaries for when exact ``nunique()`` or
+``value_counts()`` would need memory proportional to the number of distinct
+keys (restaurant names, dishes):
+
+- ``HyperLogLog``: distinct count. Relative standard error ``1.04 / sqrt(2**p)``
+  (0.81% at the default ``p=14``, 16 KiB).
+- ``CountMinSketch``: frequency of any key. Never underestimates; with
+  probability ``1 - delta`` it overestimates by at most ``epsilon * N`` (N rows).
+- ``SpaceSaving``: the most frequent keys. Keeps ``capacity`` counters; every
+  key more frequent than ``N / capacity`` is kept, and each count overestimates
+  by at most its reported ``error``, itself at most ``N / capacity``.
+
+All three hash keys with ``pandas.util.hash_pandas_object`` (deterministic
+64-bit hashes, computed once per category for categoricals), are updated a
+chunk at a time, merge in place with ``merge`` and round-trip through
+``save``/``load`` (``.npz``). Sketches only merge with sketches built with the
+same parameters.
+"""
+
+import math
+import numpy as np
+import pandas as pd
+
+
+def hash_values(values):
+    """Deterministic uint64 hash of each value"""
+    return pd.util.hash_pandas_object(pd.Series(values), index=False).to_numpy()
+
+
+class HyperLogLog:
+    """Mergeable distinct-count estimate in ``2**p`` one-byte registers"""
+
+    def __init__(self, p=14):
+        # The remaining 64 - p hash bits must fit a float64 mantissa exactly
+        if not 11 <= p <= 18:
+            raise ValueError("p must be between 11 and 18")
+        self.p = p
+        self.registers = np.zeros(1 << p, dtype=np.uint8)
+
+    def update(self, values):
+        """Add a chunk of values"""
+        hashes = hash_values(values)
+        if len(hashes) == 0:
+            return
+        bits = 64 - self.p
+        index = (hashes >> np.uint64(bits)).astype(np.intp)
+        rest = (hashes & np.uint64((1 << bits) - 1)).astype(np.float64)
+        # Rank = leading zeros in the remaining bits + 1
+        rank = (bits + 1 - np.frexp(rest)[1]).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other):
+        """Combine with another HyperLogLog in place"""
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self):
+        """Estimated number of distinct values"""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.ldexp(1.0, -self.registers.astype(np.int64)).sum()
+        zeros = int((self.registers == 0).sum())
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate while many registers are empty
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+    @property
+    def relative_error(self):
+        """Relative standard error of ``count()``"""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def save(self, path):
+        np.savez_compressed(path, kind='hll', p=self.p, registers=self.registers)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            sketch = cls(int(data['p']))
+            sketch.registers = data['registers']
+        return sketch
+
+
+class CountMinSketch:
+    """Mergeable frequency estimate in a ``depth`` x ``width`` counter table
+
+    ``width = ceil(e / epsilon)`` and ``depth = ceil(ln(1 / delta))``. The
+    rows use the double hashing ``h1 + i * h2`` of one 64-bit hash.
+    """
+
+    def __init__(self, epsilon=0.001, delta=0.01):
+        self.epsilon = epsilon
+        self.delta = delta
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.table = np.zeros((self.depth, self.width), dtype=np.int64)
+        self.total = 0
+
+    def _columns(self, hashes):
+        """Counter column of each hash in every row, shape (depth, len(hashes))"""
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        rows = np.arange(self.depth, dtype=np.uint64)[:, None]
+        return ((h1 + rows * h2) % np.uint64(self.width)).astype(np.intp)
+
+    def update(self, values):
+        """Add a chunk of values"""
+        hashes = hash_values(values)
+        for row, columns in enumerate(self._columns(hashes)):
+            self.table[row] += np.bincount(columns, minlength=self.width)
+        self.total += len(hashes)
+
+    def merge(self, other):
+        """Combine with another sketch of the same epsilon and delta in place"""
+        if self.table.shape != other.table.shape:
+            raise ValueError("Count-Min sketches differ in width or depth")
+        self.table += other.table
+        self.total += other.total
+
+    def estimate(self, values):
+        """Estimated count of each value (never below the true count)"""
+        columns = self._columns(hash_values(values))
+        return self.table[np.arange(self.depth)[:, None], columns].min(axis=0)
+
+    @property
+    def error_bound(self):
+        """Overestimate bound ``epsilon * N``, holding with probability ``1 - delta``"""
+        return self.epsilon * self.total
+
+    def save(self, path):
+        np.savez_compressed(path, kind='cms', epsilon=self.epsilon, delta=self.delta,
+                            table=self.table, total=self.total)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            sketch = cls(float(data['epsilon']), float(data['delta']))
+            sketch.table = data['table']
+            sketch.total = int(data['total'])
+        return sketch
+
+
+class SpaceSaving:
+    """Mergeable heavy hitters: counts and errors of at most ``capacity`` keys
+
+    Each chunk is counted exactly and truncated to ``capacity`` keys.
+    Summaries merge as in parallel Space-Saving (Cafaro et al.): a key missing
+    from one side is charged that side's ``floor``, the most any unmonitored
+    key can have, and the top ``capacity`` keys are kept.
+    """
+
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        self.counts = pd.DataFrame({'count': pd.Series(dtype=np.int64),
+                                    'error': pd.Series(dtype=np.int64)})
+        self.floor = 0
+        self.total = 0
+
+    def update(self, values):
+        """Add a chunk of values"""
+        chunk = SpaceSaving(self.capacity)
+        counts = pd.Series(values).value_counts()
+        counts = counts[counts > 0]
+        counts.index = pd.Index(counts.index.to_numpy())
+        chunk.counts = pd.DataFrame({'count': counts.astype(np.int64), 'error': np.int64(0)})
+        chunk.total = int(counts.sum())
+        chunk._truncate()
+        self.merge(chunk)
+
+    def merge(self, other):
+        """Combine with another summary in place"""
+        left, right = self.counts.align(other.counts)
+        left = left.fillna(self.floor)
+        right = right.fillna(other.floor)
+        self.counts = (left + right).astype(np.int64)
+        self.floor += other.floor
+        self.total += other.total
+        self._truncate()
+
+    def _truncate(self):
+        """Keep the ``capacity`` largest counts, raising the floor to the largest dropped"""
+        if len(self.counts) > self.capacity:
+            self.counts = self.counts.sort_values('count', ascending=False, kind='stable')
+            self.floor = max(self.floor, int(self.counts['count'].iloc[self.capacity]))
+            self.counts = self.counts.iloc[:self.capacity]
+
+    def top(self, k=10):
+        """The ``k`` most frequent keys: ``count`` (upper bound) and ``error``
+
+        The true count of each key lies in ``[count - error, count]``.
+        """
+        top = self.counts.sort_values('count', ascending=False, kind='stable').head(k)
+        return top.rename_axis('value')
+
+    @property
+    def error_bound(self):
+        """Largest possible overcount of any reported key, at most ``N / capacity``"""
+        return int(self.counts['error'].max()) if len(self.counts) else 0
+
+    def save(self, path):
+        """Write to ``path`` (.npz); object keys such as names are stored as strings"""
+        keys = self.counts.index.to_numpy()
+        if keys.dtype == object:
+            keys = keys.astype(str)
+        np.savez_compressed(path, kind='spacesaving', capacity=self.capacity, keys=keys,
+                            count=self.counts['count'].to_numpy(),
+                            error=self.counts['error'].to_numpy(),
+                            floor=self.floor, total=self.total)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            sketch = cls(int(data['capacity']))
+            sketch.counts = pd.DataFrame({'count': data['count'], 'error': data['error']},
+                                         index=pd.Index(data['keys'].tolist()))
+            sketch.floor = int(data['floor'])
+            sketch.total = int(data['total'])
+        return sketch
@@ -0,0 +1,175 @@
+import pandas as pd
+from data_io import SCHEMA, iter_frames
+from restaurant_analysis import RestaurantAnalysis, TOP_COLUMNS
+from accumulators import RunningStats, ValueCounts, GroupStats, CovarianceAccumulator, TopK
+from sketches import HyperLogLog, CountMinSketch, SpaceSaving
+from correlation import NUMERIC_COLUMNS, correlation_matrix
+
+
+class StreamingRestaurantAnalysis(RestaurantAnalysis):
+    """Out-of-core RestaurantAnalysis that reads the data once in chunks
+
+    ``load_data`` streams the file through mergeable accumulators instead of
+    keeping ``self.df``, so datasets larger than RAM can be analyzed in one
+    pass. The analysis methods return the same structures as the in-memory
+    versions. Leaderboards of the ``top_k`` best restaurants overall and per
+    city, cuisine and price range are kept in bounded memory.
+
+    With ``sketches=True`` the ``SKETCH_COLUMNS`` also feed fixed-size
+    approximate sketches (see ``sketches``) for distinct counts and heavy
+    hitters over keys too numerous to count exactly.
+    """
+
+    TOP_GROUPS = [None, 'city', 'cuisine', 'price_range']
+    SKETCH_COLUMNS = ['restaurant_name', 'cuisine', 'city']
+
+    def __init__(self, data_path=None, chunksize=1_000_000, top_k=10, sketches=False):
+        self.chunksize = chunksize
+        self.top_k = top_k
+        self.sketches = sketches
+        self.accumulators = None
+        super().__init__(data_path)
+
+    def load_data(self, file_path, columns=None, typed=True):
+        """Stream restaurant data through the accumulators"""
+        try:
+            acc = {
+                'rating': RunningStats(),
+                'rating_counts': ValueCounts(),
+                'cuisine_counts': ValueCounts(),
+                'cuisine_ratings': GroupStats(),
+                'price_counts': ValueCounts(),
+                'correlation': None,
+                'top': {by: TopK(self.top_k, by, TOP_COLUMNS) for by in self.TOP_GROUPS},
+                'sketches': {}
+            }
+            if self.sketches:
+                acc['sketches'] = {col: {'distinct': HyperLogLog(),
+                                         'frequency': CountMinSketch(),
+                                         'heavy': SpaceSaving()}
+                                   for col in self.SKETCH_COLUMNS}
+            for chunk in iter_frames(file_path, columns, SCHEMA if typed else None,
+                                     self.chunksize):
+                if acc['correlation'] is None:
+                    numeric_cols = [col for col in NUMERIC_COLUMNS if col in chunk.columns]
+                    acc['correlation'] = CovarianceAccumulator(numeric_cols)
+                self._update(acc, chunk)
+            self.accumulators = acc
+            self.data_path = file_path
+            print(f"Data streamed successfully. Rows: {acc['rating'].count}")
+        except Exception as e:
+            print(f"Error loading data: {e}")
+
+    def _update(self, acc, chunk):
+        """Fold one chunk into the accumulators"""
+        acc['rating'].update(chunk['rating'])
+        acc['rating_counts'].update(chunk['rating'])
+        acc['cuisine_counts'].update(chunk['cuisine'])
+        acc['cuisine_ratings'].update(chunk['cuisine'], chunk['rating'])
+        acc['price_counts'].update(chunk['price_range'])
+        acc['correlation'].update(chunk)
+        for top in acc['top'].values():
+            top.update(chunk)
+        for col, sketches in acc['sketches'].items():
+            if col in chunk.columns:
+                for sketch in sketches.values():
+                    sketch.update(chunk[col])
+
+    def rating_analysis(self):
+        """Analyze restaurant ratings distribution"""
+        if self.accumulators is None:
+            print("No data loaded")
+            return
+
+        rating = self.accumulators['rating']
+        return {
+            'Mean Rating': rating.mean,
+            'Median Rating': self.accumulators['rating_counts'].median(),
+            'Std Dev': rating.std,
+            'Min Rating': rating.min,
+            'Max Rating': rating.max
+        }
+
+    def cuisine_analysis(self):
+        """Analyze cuisine popularity"""
+        if self.accumulators is None:
+            print("No data loaded")
+            return
+
+        cuisine_counts = self.accumulators['cuisine_counts'].most_common()
+        cuisine_counts.index.name = 'cuisine'
+        cuisine_counts.name = 'count'
+        cuisine_ratings = self.accumulators['cuisine_ratings'].mean().sort_values(ascending=False)
+        cuisine_ratings.index.name = 'cuisine'
+        cuisine_ratings.name = 'rating'
+
+        return {
+            'cuisine_count': cuisine_counts,
+            'cuisine_ratings': cuisine_ratings
+        }
+
+    def price_analysis(self):
+        """Analyze pricing patterns"""
+        if self.accumulators is None:
+            print("No data loaded")
+            return
+
+        price_counts = self.accumulators['price_counts']
+        distribution = price_counts.counts.sort_index()
+        distribution.index.name = 'price_range'
+        distribution.name = 'count'
+        return {
+            'Mean Price': price_counts.mean(),
+            'Median Price': price_counts.median(),
+            'Price Distribution': distribution
+        }
+
+    def top_restaurants(self, k=10, by=None):
+        """Leaderboard of the ``k`` best rated restaurants, or ``k`` per ``by`` group"""
+        if self.accumulators is None:
+            print("No data loaded")
+            return
+        if by not in self.TOP_GROUPS or k > self.top_k:
+            print(f"Only the top {self.top_k} per {self.TOP_GROUPS[1:]} or overall are kept")
+            return
+
+        result = self.accumulators['top'][by].result()
+        return result[result['rank'] <= k].reset_index(drop=True)
+
+    def _sketch(self, column, kind):
+        if self.accumulators is None:
+            print("No data loaded")
+            return
+        if column not in self.accumulators['sketches']:
+            print(f"No sketches kept for '{column}' (use sketches=True)")
+            return
+        return self.accumulators['sketches'][column][kind]
+
+    def distinct_count(self, column='restaurant_name'):
+        """Approximate number of distinct values (HyperLogLog, ~0.8% standard error)"""
+        sketch = self._sketch(column, 'distinct')
+        return sketch.count() if sketch else None
+
+    def estimate_counts(self, values, column='restaurant_name'):
+        """Approximate occurrences of each of ``values`` (Count-Min, never low)"""
+        sketch = self._sketch(column, 'frequency')
+        return pd.Series(sketch.estimate(values), index=values, name='count') if sketch else None
+
+    def heavy_hitters(self, column='restaurant_name', k=10):
+        """Approximate ``k`` most frequent values with their count and overcount bound"""
+        sketch = self._sketch(column, 'heavy')
+        return sketch.top(k) if sketch else None
+
+    def correlation_analysis(self, method='pearson', columns=None):
+        """Analyze correlation between ratings, reviews, price and delivery
+
+        Spearman, or Pearson over other ``columns``, takes further passes
+        over the file.
+        """
+        if self.accumulators is None:
+            print("No data loaded")
+            return
+
+        if columns is not None or method != 'pearson':
+            return correlation_matrix(self.data_path, columns, method, self.chunksize)
+        return self.accumulators['correlation'].correlation()
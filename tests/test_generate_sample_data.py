@@ -0,0 +1,28 @@
+import os
+
+import pandas as pd
+import pytest
+
+from data_io import read_frame
+from generate_sample_data import RestaurantDataGenerator
+
+
+@pytest.mark.parametrize('file_format', ['csv', 'parquet'])
+def test_partitions_identical_for_any_n_jobs(tmp_path, file_format):
+    generator = RestaurantDataGenerator()
+    serial = generator.generate_partitioned(2500, str(tmp_path / 'serial'), seed=7,
+                                            chunk_size=1000, n_jobs=1, file_format=file_format)
+    parallel = generator.generate_partitioned(2500, str(tmp_path / 'parallel'), seed=7,
+                                              chunk_size=1000, n_jobs=2, file_format=file_format)
+    assert [os.path.basename(path) for path in serial] == \
+        [os.path.basename(path) for path in parallel]
+    assert len(serial) == 3
+    for left, right in zip(serial, parallel):
+        with open(left, 'rb') as a, open(right, 'rb') as b:
+            assert a.read() == b.read()
+
+    df = read_frame(str(tmp_path / 'parallel'))
+    chunks = pd.concat(generator.generate_chunks(2500, chunk_size=1000, seed=7),
+                       ignore_index=True)
+    pd.testing.assert_frame_equal(df, chunks, check_dtype=False, check_categorical=False)
+    assert df['restaurant_id'].tolist() == list(range(1, 2501))
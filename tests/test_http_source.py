@@ -0,0 +1,69 @@
+import threading
+from contextlib import contextmanager
+
+import pandas as pd
+import pytest
+
+from data_io import SCHEMA, read_frame
+from feed_server import FeedServer
+from generate_sample_data import RestaurantDataGenerator
+from http_source import read_http, write_http, page_frame
+
+
+@pytest.fixture
+def sample():
+    return RestaurantDataGenerator().generate_sample_data(num_records=2500, vectorized=True)
+
+
+@contextmanager
+def serve(df, **options):
+    """Run a FeedServer on a free port, yielding the server and its feed URL"""
+    server = FeedServer(('127.0.0.1', 0), df, **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield server, f'http://127.0.0.1:{server.server_address[1]}/restaurants'
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.parametrize('rows', [False, True])
+def test_read_http_matches_source(sample, rows):
+    with serve(sample, rows=rows) as (server, url):
+        df = read_http(url, page_size=400, max_workers=3)
+    assert (df.dtypes == pd.Series(SCHEMA).reindex(df.columns)).all()
+    pd.testing.assert_frame_equal(df, sample.astype(SCHEMA), check_categorical=False)
+
+
+def test_read_http_retries_failed_pages(sample):
+    with serve(sample, fail_rate=0.2, seed=1) as (server, url):
+        df = read_http(url, page_size=250, max_workers=4, retries=10, backoff=0)
+    assert server.failures > 0
+    assert df['restaurant_id'].tolist() == sample['restaurant_id'].tolist()
+
+
+def test_nulls_use_nullable_dtypes():
+    page = {'columns': {'cost_for_two': [500, None], 'rating': [4.2, None],
+                        'vegetarian': [True, None]}}
+    df = page_frame(page, dtype=SCHEMA)
+    assert df['cost_for_two'].dtype == 'Int16'
+    assert df['rating'].dtype == 'float64'
+    assert df['vegetarian'].dtype == 'boolean'
+    assert df['cost_for_two'].isna().tolist() == [False, True]
+
+
+def test_out_of_range_values_raise(sample):
+    sample.loc[3, 'cost_for_two'] = 40_000
+    with serve(sample) as (server, url):
+        with pytest.raises(ValueError, match="cost_for_two"):
+            read_http(url, page_size=1000, max_workers=2)
+
+
+@pytest.mark.parametrize('file_format', ['parquet', 'csv'])
+def test_written_partitions_read_back_with_schema(sample, tmp_path, file_format):
+    with serve(sample) as (server, url):
+        paths = write_http(url, str(tmp_path / 'parts'), file_format, page_size=700, max_workers=2)
+    assert len(paths) == 4
+    df = read_frame(str(tmp_path / 'parts'), dtype=SCHEMA)
+    assert (df.dtypes == pd.Series(SCHEMA).reindex(df.columns)).all()
+    pd.testing.assert_frame_equal(df, sample.astype(SCHEMA), check_categorical=False)
@@ -0,0 +1,26 @@
+import os
+import sys
+import subprocess
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Packages only the chart code paths may load
+PLOTTING = ['matplotlib', 'seaborn', 'scipy']
+
+
+def loaded_modules(module):
+    """Top-level packages in ``sys.modules`` after importing ``module`` in a fresh interpreter"""
+    code = f"import sys, {module}; print(' '.join(sorted({{name.split('.')[0] for name in sys.modules}})))"
+    result = subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT,
+                            capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize('module', ['main', 'restaurant_analysis', 'streaming_analysis',
+                                    'query_service', 'create_excel_charts_report'])
+def test_analysis_imports_skip_plotting(module):
+    loaded = loaded_modules(module)
+    assert module in loaded
+    assert not loaded & set(PLOTTING)
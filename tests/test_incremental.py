@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_io import SCHEMA
+from generate_sample_data import RestaurantDataGenerator
+from restaurant_analysis import RestaurantAnalysis
+
+
+@pytest.fixture
+def sample():
+    return RestaurantDataGenerator().generate_sample_data(num_records=4000).astype(SCHEMA)
+
+
+def analysis_of(df):
+    analysis = RestaurantAnalysis()
+    analysis.df = df
+    analysis.profile()
+    analysis.correlation_analysis()
+    return analysis
+
+
+def assert_matches_recompute(analysis):
+    """Incrementally updated results equal those of a fresh analysis of ``analysis.df``"""
+    fresh = analysis_of(analysis.df.copy())
+    profile, expected = analysis.profile(), fresh.profile()
+    assert profile['rows'] == expected['rows']
+    for key, value in expected['rating_stats'].items():
+        assert profile['rating_stats'][key] == pytest.approx(value)
+    for key in ('cuisine_count', 'city_count', 'price_count'):
+        pd.testing.assert_series_equal(profile[key], expected[key], check_index_type=False)
+    for key in ('cuisine_ratings', 'city_ratings', 'price_ratings'):
+        assert np.allclose(profile[key].sort_index(), expected[key].sort_index())
+    pd.testing.assert_frame_equal(analysis.correlation_analysis(), fresh.correlation_analysis())
+
+
+def test_append_and_retract_match_recompute(sample):
+    analysis = analysis_of(sample.iloc[:3000].reset_index(drop=True))
+    analysis.append(sample.iloc[3000:3500])
+    analysis.retract(sample.iloc[100:400])
+    analysis.retract(sample.iloc[3200:3300])
+    analysis.append(sample.iloc[3500:])
+    assert_matches_recompute(analysis)
+    kept = pd.concat([sample.iloc[:100], sample.iloc[400:3200], sample.iloc[3300:]])
+    assert sorted(analysis.df['restaurant_id']) == sorted(kept['restaurant_id'])
+
+
+def test_retract_then_append_updates_a_row(sample):
+    analysis = analysis_of(sample.iloc[:1000].reset_index(drop=True))
+    updated = sample.iloc[[10]].assign(rating=1.0)
+    analysis.retract(sample.iloc[[10]])
+    analysis.append(updated)
+    assert_matches_recompute(analysis)
+    row = analysis.df[analysis.df['restaurant_id'] == updated['restaurant_id'].iloc[0]]
+    assert row['rating'].tolist() == [1.0]
+
+
+def test_duplicate_and_unknown_ids_raise(sample):
+    analysis = analysis_of(sample.iloc[:1000].reset_index(drop=True))
+    with pytest.raises(ValueError, match="duplicate"):
+        analysis.append(sample.iloc[990:1010])
+    with pytest.raises(ValueError, match="duplicate"):
+        analysis.append(pd.concat([sample.iloc[[2000]], sample.iloc[[2000]]]))
+    analysis.retract(sample.iloc[:5])
+    with pytest.raises(ValueError, match="unknown"):
+        analysis.retract(sample.iloc[:5])
+    assert_matches_recompute(analysis)
+    assert len(analysis.df) == 995
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import parallel_groupby
+from data_io import SCHEMA
+from generate_sample_data import RestaurantDataGenerator
+from parallel_groupby import parallel_group_stats
+
+STATS = ['count', 'sum', 'mean', 'std', 'min', 'max']
+
+
+@pytest.fixture(scope='module')
+def sample():
+    return RestaurantDataGenerator().generate_sample_data(num_records=6000).astype(SCHEMA)
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    """Let frames of any size use a two-process pool, even on one CPU"""
+    monkeypatch.setattr(parallel_groupby, 'PARALLEL_MIN_ROWS', 0)
+    monkeypatch.setattr(parallel_groupby.os, 'cpu_count', lambda: 2)
+
+
+def serial_stats(df, by, value):
+    stats = df.groupby(by, observed=True)[value].agg(STATS)
+    stats.index = pd.Index(stats.index.astype(str)
+                           if isinstance(stats.index.dtype, pd.CategoricalDtype)
+                           else stats.index.to_numpy(), name=by)
+    return stats
+
+
+def assert_matches_serial(result, df, by, value):
+    """Parallel stats equal pandas' groupby after aligning the index
+
+    The parallel path returns plain group values while the serial groupby
+    returns a categorical index, and the two sort differently.
+    """
+    expected = serial_stats(df, by, value)
+    result = result.copy()
+    result.index = pd.Index(result.index.to_numpy(), name=by)
+    result = result.reindex(expected.index)
+    assert result['count'].tolist() == expected['count'].tolist()
+    assert np.allclose(result[STATS[1:]].to_numpy(), expected[STATS[1:]].to_numpy())
+
+
+@pytest.mark.parametrize('by, value', [('city', 'rating'), ('cuisine', 'cost_for_two'),
+                                       ('price_range', 'delivery_time')])
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_frame_stats_match_serial_groupby(sample, pool, by, value, n_jobs):
+    result = parallel_group_stats(sample, by, value, n_jobs=n_jobs, partition_rows=1000)
+    assert_matches_serial(result, sample, by, value)
+
+
+def test_directory_stats_match_serial_groupby(sample, pool, tmp_path):
+    for index, start in enumerate(range(0, len(sample), 2000)):
+        sample.iloc[start:start + 2000].to_parquet(tmp_path / f'part-{index:05d}.parquet')
+    result = parallel_group_stats(str(tmp_path), 'city', 'rating', n_jobs=2)
+    assert_matches_serial(result, sample, 'city', 'rating')
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from generate_sample_data import RestaurantDataGenerator
+from restaurant_analysis import RestaurantAnalysis
+
+
+@pytest.fixture
+def sample():
+    return RestaurantDataGenerator().generate_sample_data(num_records=5000)
+
+
+def with_missing_keys(df, rows=100, seed=0):
+    """``df`` with NaN cuisine, city, price range and rating in random rows"""
+    df = df.copy()
+    rng = np.random.default_rng(seed)
+    for col in ['cuisine', 'city', 'price_range', 'rating']:
+        df.loc[rng.choice(len(df), rows, replace=False), col] = np.nan
+    return df
+
+
+def analysis_of(df):
+    analysis = RestaurantAnalysis()
+    analysis.df = df
+    return analysis
+
+
+def assert_profile_matches_pandas(profile, df):
+    assert profile['rows'] == len(df)
+    stats = profile['rating_stats']
+    assert stats['Mean Rating'] == pytest.approx(df['rating'].mean())
+    assert stats['Median Rating'] == pytest.approx(df['rating'].median())
+    assert stats['Std Dev'] == pytest.approx(df['rating'].std())
+    assert stats['Min Rating'] == df['rating'].min()
+    assert stats['Max Rating'] == df['rating'].max()
+    for col, name in (('cuisine', 'cuisine'), ('city', 'city'), ('price_range', 'price')):
+        counts = df[col].value_counts()
+        counts = counts[counts > 0]
+        assert profile[f'{name}_count'].sort_index().tolist() == counts.sort_index().tolist()
+        means = df.groupby(col, observed=True)['rating'].mean()
+        assert np.allclose(profile[f'{name}_ratings'].sort_index().to_numpy(),
+                           means.sort_index().to_numpy(), equal_nan=True)
+    assert profile['price_stats']['Mean Price'] == pytest.approx(df['price_range'].mean())
+
+
+@pytest.mark.parametrize('categorical', [False, True])
+def test_profile_counts_rows_with_missing_keys(sample, categorical):
+    df = with_missing_keys(sample)
+    if categorical:
+        df = df.astype({'cuisine': 'category', 'city': 'category'})
+    assert_profile_matches_pandas(analysis_of(df).profile(), df)
+
+
+def test_appended_missing_keys_match_recompute(sample):
+    df = with_missing_keys(sample)
+    analysis = analysis_of(df.iloc[:3000].reset_index(drop=True))
+    analysis.profile()
+    analysis.append(df.iloc[3000:])
+    assert_profile_matches_pandas(analysis.profile(), df)
+
+
+def test_empty_profile_is_nan(sample):
+    for analysis in (analysis_of(sample.iloc[:0]), analysis_of(sample.iloc[:50])):
+        analysis.profile()
+        if analysis.profile()['rows']:
+            analysis.retract(sample.iloc[:50])
+        stats = analysis.rating_analysis()
+        assert analysis.profile()['rows'] == 0
+        assert all(np.isnan(value) for value in stats.values())
+        assert np.isnan(analysis.profile()['price_stats']['Median Price'])
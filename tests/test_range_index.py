@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from generate_sample_data import RestaurantDataGenerator
+from range_index import RangeIndex
+from data_io import SCHEMA
+
+BOUNDS = [None, -np.inf, np.inf, -1, 0, 3.0, 4, 4.25, 500, 900, 40_000]
+
+
+@pytest.fixture(scope='module')
+def frame():
+    df = RestaurantDataGenerator().generate_sample_data(num_records=3000).astype(SCHEMA)
+    rng = np.random.default_rng(0)
+    df['rating'] = df['rating'].where(rng.random(len(df)) > 0.05)
+    df['num_reviews'] = df['num_reviews'].astype('Int16').where(rng.random(len(df)) > 0.05)
+    return df
+
+
+def expected(df, **ranges):
+    """Row positions the equivalent pandas boolean mask selects; NaN never matches"""
+    mask = np.ones(len(df), dtype=bool)
+    for col, (low, high) in ranges.items():
+        values = df[col].astype('float64')
+        mask &= values.notna().to_numpy()
+        if low is not None:
+            mask &= (values >= low).fillna(False).to_numpy()
+        if high is not None:
+            mask &= (values <= high).fillna(False).to_numpy()
+    return np.flatnonzero(mask)
+
+
+def test_nan_values_never_match():
+    df = pd.DataFrame({'rating': [4.5, np.nan, 3.0, np.nan]})
+    index = RangeIndex(df, ['rating'])
+    assert index.query(rating=(4, None)).tolist() == [0]
+    assert index.query(rating=(None, np.inf)).tolist() == [0, 2]
+    assert sorted(index.range('rating', -np.inf, None)) == [0, 2]
+
+
+@pytest.mark.parametrize('col', ['rating', 'cost_for_two', 'num_reviews'])
+def test_single_predicates_match_pandas(frame, col):
+    index = RangeIndex(frame)
+    for low in BOUNDS:
+        for high in BOUNDS:
+            assert index.query(**{col: (low, high)}).tolist() == \
+                expected(frame, **{col: (low, high)}).tolist(), (low, high)
+
+
+@pytest.mark.parametrize('ranges', [
+    {'rating': (4, None), 'cost_for_two': (500, 900)},
+    {'rating': (None, np.inf), 'num_reviews': (-np.inf, 200)},
+    {'cost_for_two': (None, 40_000), 'rating': (4.25, None), 'num_reviews': (100, None)},
+    {'delivery_time': (-np.inf, 30), 'num_reviews': (np.inf, None)},
+    {'rating': (2.5, 2.5), 'cost_for_two': (900, 500)},
+])
+def test_combined_predicates_match_pandas(frame, ranges):
+    assert RangeIndex(frame).query(**ranges).tolist() == expected(frame, **ranges).tolist()
+
+
+def test_nan_bound_raises(frame):
+    with pytest.raises(ValueError):
+        RangeIndex(frame).query(rating=(np.nan, None))
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.sketch_accuracy import generate_keys, exact_counts, build, round_trip
+from sketches import HyperLogLog, CountMinSketch, SpaceSaving
+
+ROWS = 200_000
+CHUNKSIZE = 30_000
+WORKERS = 3
+
+
+@pytest.fixture(scope='module')
+def keys():
+    return generate_keys(ROWS, 1.2)
+
+
+@pytest.fixture(scope='module')
+def exact(keys):
+    return exact_counts(keys)
+
+
+def test_hyperloglog_within_error(keys, exact, tmp_path):
+    hll = build(keys, CHUNKSIZE, WORKERS, lambda: HyperLogLog(12))
+    loaded = round_trip(hll, str(tmp_path))
+    assert loaded.count() == hll.count()
+    assert abs(hll.count() - len(exact)) <= 4 * hll.relative_error * len(exact)
+
+
+def test_count_min_never_undercounts(keys, exact, tmp_path):
+    epsilon, delta = 0.001, 0.01
+    cms = build(keys, CHUNKSIZE, WORKERS, lambda: CountMinSketch(epsilon, delta))
+    loaded = round_trip(cms, str(tmp_path))
+    estimates = loaded.estimate(exact.index.to_numpy())
+    assert (estimates == cms.estimate(exact.index.to_numpy())).all()
+    overcount = estimates - exact.to_numpy()
+    assert overcount.min() >= 0
+    assert (overcount > cms.error_bound).mean() <= delta
+
+
+def test_space_saving_brackets_true_counts(keys, exact, tmp_path):
+    capacity = 500
+    space_saving = build(keys, CHUNKSIZE, WORKERS, lambda: SpaceSaving(capacity))
+    top = round_trip(space_saving, str(tmp_path)).top(capacity)
+    pd.testing.assert_frame_equal(top, space_saving.top(capacity))
+    true = exact.reindex(top.index, fill_value=0)
+    assert (top['count'] >= true).all()
+    assert (top['count'] - top['error'] <= true).all()
+    bound = ROWS / capacity
+    assert space_saving.error_bound <= bound
+    assert not len(exact.index[exact > bound].difference(top.index))
+
+
+def test_sketches_on_exact_small_input():
+    values = pd.Series(['a', 'b', 'a', 'c', 'a', 'b'])
+    hll = HyperLogLog()
+    hll.update(values)
+    assert hll.count() == 3
+    cms = CountMinSketch()
+    cms.update(values)
+    assert cms.estimate(np.array(['a', 'b', 'c'])).tolist() == [3, 2, 1]
+    space_saving = SpaceSaving(10)
+    space_saving.update(values)
+    assert space_saving.top(2)['count'].tolist() == [3, 2]
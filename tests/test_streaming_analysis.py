@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from generate_sample_data import RestaurantDataGenerator
+from restaurant_analysis import RestaurantAnalysis
+from streaming_analysis import StreamingRestaurantAnalysis
+
+
+@pytest.fixture(scope='module', params=['csv', 'parquet'])
+def data_path(request, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('data') / f'restaurants.{request.param}')
+    generator = RestaurantDataGenerator()
+    generator.save_data(generator.generate_sample_data(num_records=5000), path)
+    return path
+
+
+@pytest.fixture(scope='module')
+def analyses(data_path):
+    return RestaurantAnalysis(data_path), StreamingRestaurantAnalysis(data_path, chunksize=700)
+
+
+def assert_close(left, right):
+    """Equal dicts, Series or frames, floats compared approximately"""
+    if isinstance(left, dict):
+        assert left.keys() == right.keys()
+        for key in left:
+            assert_close(left[key], right[key])
+    elif isinstance(left, pd.Series):
+        pd.testing.assert_series_equal(left, right, check_names=False, check_index_type=False,
+                                       check_dtype=False, check_categorical=False)
+    elif isinstance(left, pd.DataFrame):
+        pd.testing.assert_frame_equal(left, right, check_dtype=False, check_categorical=False,
+                                      check_index_type=False)
+    else:
+        assert left == pytest.approx(right)
+
+
+@pytest.mark.parametrize('method', ['rating_analysis', 'cuisine_analysis', 'price_analysis',
+                                    'correlation_analysis'])
+def test_streaming_matches_in_memory(analyses, method):
+    memory, streaming = analyses
+    assert_close(getattr(streaming, method)(), getattr(memory, method)())
+
+
+@pytest.mark.parametrize('by', StreamingRestaurantAnalysis.TOP_GROUPS)
+def test_streaming_leaderboards_match_in_memory(analyses, by):
+    memory, streaming = analyses
+    assert_close(streaming.top_restaurants(10, by).reset_index(drop=True),
+                 memory.top_restaurants(10, by).reset_index(drop=True))
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from data_io import SCHEMA
+from generate_sample_data import RestaurantDataGenerator
+from restaurant_analysis import top_k
+
+ORDER = ['rating', 'num_reviews', 'restaurant_id']
+
+
+@pytest.fixture
+def sample():
+    return RestaurantDataGenerator().generate_sample_data(num_records=4000).astype(SCHEMA)
+
+
+@pytest.mark.parametrize('by', [None, 'city'])
+def test_leaderboard_skips_missing_ratings(sample, by):
+    df = sample.iloc[:30].copy()
+    df.loc[df.index[5:], 'rating'] = np.nan
+    top = top_k(df, 10, by).result()
+    assert sorted(top['restaurant_id']) == sorted(df['restaurant_id'].iloc[:5])
+
+
+def test_leaderboard_matches_sort_with_missing_ratings(sample):
+    df = sample.copy()
+    df.loc[df.index[::3], 'rating'] = np.nan
+    top = top_k(df, 25).result()
+    expected = df.dropna(subset=['rating']).sort_values(
+        ORDER, ascending=[False, False, True]).head(25)
+    assert top['restaurant_id'].tolist() == expected['restaurant_id'].tolist()
@@ -1,41 +1,160 @@
+import functools
 import matplotlib.pyplot as plt
-import seaborn as sns
 import pandas as pd
 import numpy as np
+from restaurant_analysis import build_profile
+from correlation import NUMERIC_COLUMNS, pearson_matrix
+from render_pipeline import render_charts
+
+def chart_style():
+    """rcParams applied to every chart (seaborn whitegrid, 12x6 figures)"""
+    import seaborn as sns
+    style = dict(sns.axes_style('whitegrid'))
+    style['figure.figsize'] = (12, 6)
+    return style
+
+
+def styled(plot):
+    """Draw ``plot`` under ``chart_style()`` without touching global rcParams"""
+    @functools.wraps(plot)
+    def wrapper(*args, **kwargs):
+        with plt.rc_context(chart_style()):
+            return plot(*args, **kwargs)
+    return wrapper
+
+
+# Above this many outliers the box plot draws each distinct outlier value once
+MAX_REPEATED_FLIERS = 10_000
+
+
+def _value_at(values, cumulative, rank):
+    """Value at 0-based ``rank`` of the sorted data described by a histogram"""
+    return values[np.searchsorted(cumulative, rank, side='right')]
+
+
+def _percentile_from_counts(values, cumulative, q):
+    """``np.percentile(data, q)`` (linear method) computed from value counts"""
+    position = (cumulative[-1] - 1) * q / 100
+    lower = int(np.floor(position))
+    t = position - lower
+    a = _value_at(values, cumulative, lower)
+    b = _value_at(values, cumulative, min(lower + 1, cumulative[-1] - 1))
+    diff = b - a
+    return b - diff * (1 - t) if t >= 0.5 else a + diff * t
+
+
+def box_stats_from_counts(counts, whis=1.5):
+    """Box plot statistics for ``Axes.bxp`` from a value -> count histogram
+    
+    Matches ``matplotlib.cbook.boxplot_stats`` on the raw values. Outliers
+    are repeated once per row unless there are more than
+    ``MAX_REPEATED_FLIERS`` of them, in which case each value is drawn once.
+    """
+    counts = counts[counts > 0].sort_index()
+    values = counts.index.to_numpy()
+    weights = counts.to_numpy()
+    cumulative = np.cumsum(weights)
+    total = cumulative[-1]
+    
+    q1, med, q3 = (_percentile_from_counts(values, cumulative, q) for q in (25, 50, 75))
+    iqr = q3 - q1
+    if iqr == 0:
+        loval, hival = values[0], values[-1]
+    else:
+        loval, hival = q1 - whis * iqr, q3 + whis * iqr
+    
+    inside_hi = values[values <= hival]
+    whishi = q3 if len(inside_hi) == 0 or inside_hi.max() < q3 else inside_hi.max()
+    inside_lo = values[values >= loval]
+    whislo = q1 if len(inside_lo) == 0 or inside_lo.min() > q1 else inside_lo.min()
+    
+    outside = (values < whislo) | (values > whishi)
+    if weights[outside].sum() <= MAX_REPEATED_FLIERS:
+        fliers = np.repeat(values[outside], weights[outside])
+    else:
+        fliers = values[outside]
+    
+    notch = 1.57 * iqr / np.sqrt(total)
+    return {
+        'mean': (values.astype(np.float64) * weights).sum() / total,
+        'med': med, 'q1': q1, 'q3': q3, 'iqr': iqr,
+        'cilo': med - notch, 'cihi': med + notch,
+        'whislo': whislo, 'whishi': whishi,
+        'fliers': fliers
+    }
+
+
+# Output filename and plotting method of every standard chart
+CHARTS = [
+    ('rating_distribution.png', 'plot_rating_distribution'),
+    ('cuisine_analysis.png', 'plot_cuisine_analysis'),
+    ('price_analysis.png', 'plot_price_analysis'),
+    ('city_analysis.png', 'plot_city_analysis'),
+    ('correlation_heatmap.png', 'plot_correlation_heatmap')
+]
+
 
 class RestaurantVisualizations:
     """Create visualizations for restaurant analysis"""
     
-    def __init__(self, df):
-        """Initialize with dataframe"""
+    def __init__(self, df=None, profile=None, correlation=None):
+        """Initialize with dataframe and/or precomputed aggregates
+        
+        Pass ``RestaurantAnalysis.profile()`` (and ``correlation_analysis()``)
+        to plot from aggregates only: histograms are drawn from rating value
+        counts, the box plot from quantile/whisker statistics and the bar
+        charts from group summaries, so rendering cost no longer grows with
+        the number of rows. ``df`` may then be omitted.
+        """
         self.df = df
-        sns.set_style('whitegrid')
-        plt.rcParams['figure.figsize'] = (12, 6)
+        self._profile = profile
+        self._correlation = correlation
+    
+    @property
+    def profile(self):
+        """Group summaries shared by the charts, computed once per instance"""
+        if self._profile is None:
+            self._profile = build_profile(self.df)
+        return self._profile
     
+    @property
+    def correlation(self):
+        """Correlation matrix for the heatmap, computed once per instance"""
+        if self._correlation is None:
+            numeric_cols = [col for col in NUMERIC_COLUMNS if col in self.df.columns]
+            self._correlation = pearson_matrix(self.df, numeric_cols)
+        return self._correlation
+    
+    @styled
     def plot_rating_distribution(self):
         """Plot histogram of rating distribution"""
         fig, axes = plt.subplots(1, 2, figsize=(14, 5))
         
-        # Histogram
-        axes[0].hist(self.df['rating'], bins=20, color='skyblue', edgecolor='black')
+        # Histogram, binned from rating value counts with the edges hist() would use
+        rating_counts = self.profile['rating_counts']
+        values = rating_counts.index.to_numpy()
+        edges = np.histogram_bin_edges(values, bins=20)
+        axes[0].hist(values, bins=edges, weights=rating_counts.to_numpy(),
+                     color='skyblue', edgecolor='black')
         axes[0].set_title('Rating Distribution', fontsize=14, fontweight='bold')
         axes[0].set_xlabel('Rating')
         axes[0].set_ylabel('Frequency')
         
         # Box plot
-        axes[1].boxplot(self.df['rating'])
+        axes[1].bxp([box_stats_from_counts(rating_counts)])
         axes[1].set_title('Rating Box Plot', fontsize=14, fontweight='bold')
         axes[1].set_ylabel('Rating')
         
         plt.tight_layout()
         return fig
     
+    @styled
     def plot_cuisine_analysis(self):
         """Plot top cuisines by count and rating"""
         fig, axes = plt.subplots(1, 2, figsize=(14, 5))
         
         # Top cuisines by count
-        cuisine_counts = self.df['cuisine'].value_counts().head(10)
+        cuisine_counts = self.profile['cuisine_count'].head(10)
         axes[0].barh(range(len(cuisine_counts)), cuisine_counts.values, color='coral')
         axes[0].set_yticks(range(len(cuisine_counts)))
         axes[0].set_yticklabels(cuisine_counts.index)
@@ -44,7 +163,7 @@ class RestaurantVisualizations:
         axes[0].invert_yaxis()
         
         # Average rating by cuisine
-        cuisine_ratings = self.df.groupby('cuisine')['rating'].mean().sort_values(ascending=False).head(10)
+        cuisine_ratings = self.profile['cuisine_ratings'].head(10)
         axes[1].barh(range(len(cuisine_ratings)), cuisine_ratings.values, color='lightgreen')
         axes[1].set_yticks(range(len(cuisine_ratings)))
         axes[1].set_yticklabels(cuisine_ratings.index)
@@ -55,12 +174,13 @@ class RestaurantVisualizations:
         plt.tight_layout()
         return fig
     
+    @styled
     def plot_price_analysis(self):
         """Plot price range distribution"""
         fig, axes = plt.subplots(1, 2, figsize=(14, 5))
         
         # Price range count
-        price_counts = self.df['price_range'].value_counts().sort_index()
+        price_counts = self.profile['price_count']
         axes[0].bar(price_counts.index, price_counts.values, color='purple', alpha=0.7)
         axes[0].set_title('Distribution by Price Range', fontsize=14, fontweight='bold')
         axes[0].set_xlabel('Price Range')
@@ -68,7 +188,7 @@ class RestaurantVisualizations:
         axes[0].set_xticks([1, 2, 3, 4])
         
         # Average rating by price range
-        price_ratings = self.df.groupby('price_range')['rating'].mean()
+        price_ratings = self.profile['price_ratings']
         axes[1].bar(price_ratings.index, price_ratings.values, color='gold', alpha=0.7)
         axes[1].set_title('Average Rating by Price Range', fontsize=14, fontweight='bold')
         axes[1].set_xlabel('Price Range')
@@ -78,12 +198,13 @@ class RestaurantVisualizations:
         plt.tight_layout()
         return fig
     
+    @styled
     def plot_city_analysis(self):
         """Plot analysis by city"""
         fig, axes = plt.subplots(1, 2, figsize=(14, 5))
         
         # Restaurants by city
-        city_counts = self.df['city'].value_counts()
+        city_counts = self.profile['city_count']
         axes[0].bar(city_counts.index, city_counts.values, color='teal', alpha=0.7)
         axes[0].set_title('Restaurants by City', fontsize=14, fontweight='bold')
         axes[0].set_xlabel('City')
@@ -91,7 +212,7 @@ class RestaurantVisualizations:
         axes[0].tick_params(axis='x', rotation=45)
         
         # Average rating by city
-        city_ratings = self.df.groupby('city')['rating'].mean().sort_values(ascending=False)
+        city_ratings = self.profile['city_ratings']
         axes[1].bar(city_ratings.index, city_ratings.values, color='salmon', alpha=0.7)
         axes[1].set_title('Average Rating by City', fontsize=14, fontweight='bold')
         axes[1].set_xlabel('City')
@@ -101,10 +222,11 @@ class RestaurantVisualizations:
         plt.tight_layout()
         return fig
     
+    @styled
     def plot_correlation_heatmap(self):
         """Plot correlation heatmap for numeric features"""
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns
-        correlation_matrix = self.df[numeric_cols].corr()
+        import seaborn as sns
+        correlation_matrix = self.correlation
         
         fig, ax = plt.subplots(figsize=(10, 8))
         sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', center=0, 
@@ -114,18 +236,27 @@ class RestaurantVisualizations:
         plt.tight_layout()
         return fig
     
-    def create_all_visualizations(self, save_path=None):
-        """Create and optionally save all visualizations"""
-        figures = [
-            ('rating_distribution.png', self.plot_rating_distribution()),
-            ('cuisine_analysis.png', self.plot_cuisine_analysis()),
-            ('price_analysis.png', self.plot_price_analysis()),
-            ('city_analysis.png', self.plot_city_analysis()),
-            ('correlation_heatmap.png', self.plot_correlation_heatmap())
-        ]
+    def create_all_visualizations(self, save_path=None, n_jobs=None, cache_dir=None):
+        """Create all visualizations, or render them to ``save_path``
         
+        Without ``save_path`` the five figures are built and returned as
+        ``(filename, figure)`` pairs. With ``save_path`` they go through
+        ``render_all`` instead and ``(filename, seconds)`` pairs are returned.
+        """
         if save_path:
-            for filename, fig in figures:
-                fig.savefig(f'{save_path}/{filename}', dpi=300, bbox_inches='tight')
+            return self.render_all(save_path, n_jobs=n_jobs, cache_dir=cache_dir)
+        
+        return [(filename, getattr(self, method)()) for filename, method in CHARTS]
+    
+    def render_all(self, save_path, n_jobs=None, dpi=300, cache_dir=None):
+        """Render every chart to PNG in worker processes on the Agg backend
         
-        return figures
+        Workers receive an aggregate-only copy of this object, so the frame
+        is never pickled, and each figure is closed once its PNG is written.
+        With ``cache_dir`` set, charts whose aggregates, code and style are
+        unchanged since an earlier render are copied from the render cache.
+        """
+        aggregates = RestaurantVisualizations(profile=self.profile, correlation=self.correlation)
+        charts = [(filename, getattr(aggregates, method), ()) for filename, method in CHARTS]
+        return render_charts(charts, save_path, n_jobs=n_jobs, dpi=dpi, rc=chart_style(),
+                             cache_dir=cache_dir)